@@ -1,5 +1,4 @@
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import plotly.graph_objects as go
 import os
@@ -7,12 +6,18 @@ from datetime import date
 
 from strategy.register import load_strategies
 from engine import run_backtest
+from market_data.sources import YahooFinanceSource
+from market_data.store import LocalMarketDataStore
+from performance.profiling import Profiler
+from result_cache import ResultCache, cached_backtest
 
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(page_title="Backtesting Terminal", layout="wide")
 
 STRATEGIES = load_strategies()
+MARKET_DATA = LocalMarketDataStore(YahooFinanceSource())
+RESULTS = ResultCache()
 
 
 # ---------------- SIDEBAR ----------------
@@ -34,6 +39,14 @@ with st.sidebar:
         list(STRATEGIES.keys())
     )
 
+    # parameter schema comes from the manifest; nothing is imported yet
+    strategy_params = {}
+    for param, default in STRATEGIES.params(selected_strategy_name).items():
+        if isinstance(default, (int, float)) and not isinstance(default, bool):
+            strategy_params[param] = st.number_input(param, value=default)
+
+    profile = st.checkbox("Profile engine", value=False)
+
     st.divider()
     run = st.button(" EXECUTE BACKTEST", use_container_width=True, type="primary")
 
@@ -50,37 +63,46 @@ if run:
 
     with st.status("Running Backtest...", expanded=True) as status:
 
-        st.write("📥 Downloading data")
-        data = yf.download(ticker, start=start_date, end=end_date)
+        st.write("📥 Loading data (downloading missing ranges only)")
+        try:
+            data = MARKET_DATA.get_history(ticker, start_date, end_date)
+        except ConnectionError as e:
+            st.error(f"Download failed, try again later: {e}")
+            st.stop()
 
         if data.empty:
             st.error("No data found — check ticker or dates")
             st.stop()
 
-        if isinstance(data.columns, pd.MultiIndex):
-            data.columns = data.columns.get_level_values(0)
-
-        data = data[["Open", "High", "Low", "Close", "Volume"]]
-        data.dropna(inplace=True)
-        data.reset_index(inplace=True)
-
         os.makedirs("data", exist_ok=True)
         csv_path = f"data/{ticker}.csv"
         data.to_csv(csv_path, index=False)
 
         st.write("⚙️ Running event-driven simulation")
-        history, trades, metrics = run_backtest(
-            strategy_class=strategy_class,
-            symbol=ticker,
-            csv_path=csv_path,
-            initial_capital=capital
-        )
+        profiler = Profiler() if profile else None
+        if profiler:
+            history, trades, metrics = run_backtest(
+                strategy_class=strategy_class,
+                symbol=ticker,
+                csv_path=csv_path,
+                initial_capital=capital,
+                strategy_params=strategy_params,
+                profiler=profiler,
+                record_bars=True
+            )
+        else:
+            # identical data + strategy code + capital -> stored result
+            history, trades, metrics = cached_backtest(
+                RESULTS, strategy_class, ticker, csv_path, capital, strategy_params,
+                record_bars=True
+            )
 
         status.update(label="Backtest Complete", state="complete", expanded=False)
 
     # ---------------- DATAFRAMES ----------------
-    history_df = pd.DataFrame(history)
-    trades_df = pd.DataFrame(trades)
+    # equity on every bar; columnar recorders convert without copying
+    history_df = history.to_frame()
+    trades_df = trades.to_frame()
 
     if history_df.empty:
         st.warning("Strategy produced no results.")
@@ -104,12 +126,13 @@ if run:
     k4.metric("Drawdown", f"{metrics.get('Max Drawdown %', 0):.2f}%", delta_color="inverse")
 
     # ---------------- TABS ----------------
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
         "📊 Price & Equity",
         "📜 Trade Log",
         "🧪 Metrics",
         "🧠 Summary",
-        "🕒 Trade Timeline"
+        "🕒 Trade Timeline",
+        "⏱️ Profile"
     ])
 
     # ----- TAB 1 PRICE + EQUITY -----
@@ -209,3 +232,21 @@ if run:
         )
 
         st.plotly_chart(fig, use_container_width=True)
+
+    # ----- TAB 6 PROFILE -----
+    with tab6:
+        if profiler is None:
+            st.info('Enable "Profile engine" in the sidebar to time each handler.')
+        else:
+            summary = profiler.summary()
+
+            p1, p2, p3 = st.columns(3)
+            p1.metric("Bars / second", f"{summary['bars_per_second']:,.0f}")
+            p2.metric("Engine time", f"{summary['wall_seconds']:.3f}s")
+            p3.metric("Dispatch overhead", f"{summary['dispatch_overhead_s']:.3f}s")
+
+            st.subheader("Per-handler timing")
+            st.dataframe(profiler.handler_table(), use_container_width=True)
+
+            st.subheader("Events by type")
+            st.table(pd.Series(summary["events"], name="Count"))
@@ -0,0 +1,403 @@
+# benchmarks/run.py
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import write_synthetic_csv, write_universe
+
+
+STRATEGIES = ["MovingAverageCrossStrategy", "BreakoutStrategy", "RSIReversionStrategy"]
+DEFAULT_STAGES = ["load", "load_cached", "dispatch", "strategies", "full", "metrics", "multi"]
+
+
+class NoopStrategy:
+    """
+    Strategy that never signals: isolates data + event dispatch cost.
+    """
+
+    def __init__(self, events, symbol):
+        pass
+
+    def calculate_signals(self, event):
+        pass
+
+
+def _strategy_class(name):
+    from strategy.register import load_strategies
+    return load_strategies()[name]
+
+
+def _reset_peak_rss():
+    """
+    Resets the kernel's peak-RSS mark for this process (Linux); returns
+    False where that is not possible.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _peak_rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _current_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return _peak_rss_mb()
+
+
+class _Section:
+    """
+    Times the measured part of a stage and the memory it adds: the peak
+    RSS while it runs (the peak mark is reset on entry) minus the RSS on
+    entry, so setup work before it is not counted. Where the peak cannot
+    be reset (macOS) the process's all-time peak is used instead.
+    """
+
+    def __enter__(self):
+        _reset_peak_rss()
+        self.rss_before = _current_rss_mb()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds = time.perf_counter() - self.start
+        self.peak_rss_mb = _peak_rss_mb()
+        self.delta_rss_mb = self.peak_rss_mb - self.rss_before
+        return False
+
+
+# ---- STAGES (each runs in a fresh process) ----
+# each returns {name: (seconds, items, section)}
+
+def _stage_load(csv_path):
+    from data_handler.csv_data_handler import parse_csv
+    with _Section() as section:
+        bars = parse_csv(csv_path)
+    return {"load": (section.seconds, len(bars["Date"]), section)}
+
+
+def _warm_cache(csv_path):
+    from data_handler.bar_cache import load_bars
+    from data_handler.csv_data_handler import parse_csv
+
+    load_bars(csv_path, parse_csv)
+    return {}
+
+
+def _stage_load_cached(csv_path):
+    from data_handler.bar_cache import load_bars
+    from data_handler.csv_data_handler import parse_csv
+
+    with _Section() as section:
+        bars = load_bars(csv_path, parse_csv)
+        for values in bars.values():
+            np.sum(values)  # touch every page of the mapping
+    return {"load_cached": (section.seconds, len(bars["Date"]), section)}
+
+
+def _stage_dispatch(csv_path):
+    from engine import run_backtest
+    from data_handler.bar_cache import load_bars
+    from data_handler.csv_data_handler import parse_csv
+
+    n = len(load_bars(csv_path, parse_csv)["Date"])
+    with _Section() as section:
+        run_backtest(NoopStrategy, "BENCH", csv_path, 100000)
+    return {"dispatch": (section.seconds, n, section)}
+
+
+def _stage_strategies(csv_path):
+    """
+    Profiled runs of every bundled strategy: strategy and portfolio
+    handler time are reported as separate stages.
+    """
+    from engine import run_backtest
+    from performance.profiling import Profiler
+
+    results = {}
+    for name in STRATEGIES:
+        strategy_class = _strategy_class(name)
+        profiler = Profiler()
+        with _Section() as section:
+            run_backtest(strategy_class, "BENCH", csv_path, 100000, profiler=profiler)
+        table = profiler.handler_table()
+
+        strategy_time = table[table["handler"].str.contains(name)]["total_s"].sum()
+        portfolio_time = table[table["handler"].str.contains("Portfolio.")]["total_s"].sum()
+        results[f"strategy:{name}"] = (strategy_time, profiler.bars, section)
+        results[f"portfolio:{name}"] = (portfolio_time, profiler.bars, section)
+    return results
+
+
+def _stage_full(csv_path):
+    from engine import run_backtest
+
+    results = {}
+    for name in STRATEGIES:
+        strategy_class = _strategy_class(name)
+        with _Section() as section:
+            history, trades, metrics = run_backtest(strategy_class, "BENCH", csv_path, 100000)
+        del history, trades, metrics
+        results[f"run_backtest:{name}"] = (section.seconds, None, section)
+    return results
+
+
+def _stage_metrics(n_records):
+    from performance.metrics import compute_metrics
+    from portfolio.recorder import HOLDINGS_COLUMNS, ColumnarRecorder
+
+    totals = 100000 * np.exp(np.cumsum(np.random.default_rng(0).normal(0, 0.001, n_records)))
+    history = ColumnarRecorder.from_arrays(HOLDINGS_COLUMNS, {
+        "time": np.arange(n_records, dtype=np.int64),
+        "cash": np.zeros(n_records),
+        "position": np.zeros(n_records, dtype=np.int64),
+        "holdings": totals,
+        "total": totals,
+    })
+
+    with _Section() as section:
+        compute_metrics(history)
+    return {"metrics": (section.seconds, n_records, section)}
+
+
+def _stage_multi(data_dir):
+    from data_handler.multi_csv_data_handler import MultiCSVDataHandler
+
+    class Sink:
+        count = 0
+
+        def put(self, event):
+            self.count += 1
+
+    sink = Sink()
+    with _Section() as section:
+        data = MultiCSVDataHandler(sink, data_dir)
+        while data.continue_backtest:
+            data.update_bars()
+    return {"multi_merge": (section.seconds, sink.count, section)}
+
+
+def _in_child(stage, arg):
+    # import cost is not part of any stage
+    import engine
+
+    results = stage(arg)
+    return {
+        name: {"seconds": seconds, "items": items, "peak_rss_mb": section.peak_rss_mb,
+               "delta_rss_mb": section.delta_rss_mb}
+        for name, (seconds, items, section) in results.items()
+    }
+
+
+def run_stage(stage, arg):
+    """
+    Runs a stage in a fresh spawned process so its peak RSS is its own.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(_in_child, stage, arg).result()
+
+
+def run_suite(bar_sizes, symbol_counts, data_dir="bench_data", stages=DEFAULT_STAGES,
+              log=print):
+    """
+    Runs the selected stages for every size and returns {"meta": ...,
+    "results": {key: {seconds, items, throughput, peak_rss_mb,
+    delta_rss_mb}}}. Single-symbol stages run once per bar count; the
+    multi-symbol merge runs for every symbol count above one.
+    """
+    results = {}
+
+    def record(size, n_bars, stage_results):
+        for name, result in stage_results.items():
+            if result["items"] is None:
+                result["items"] = n_bars
+            result["throughput"] = result["items"] / result["seconds"] if result["seconds"] else None
+            results[f"{name}|{size}"] = result
+            log(f"{name:45s} {size:28s} {result['seconds']:9.3f}s "
+                f"{result['throughput'] or 0:14,.0f}/s {result['delta_rss_mb']:9.1f} MB")
+
+    for n_bars in bar_sizes:
+        size = f"bars={n_bars}"
+        csv_path = write_synthetic_csv(os.path.join(data_dir, f"{n_bars}x1", "SYM000.csv"), n_bars)
+
+        plan = {
+            "load": (_stage_load, csv_path),
+            "load_cached": (_stage_load_cached, csv_path),
+            "dispatch": (_stage_dispatch, csv_path),
+            "strategies": (_stage_strategies, csv_path),
+            "full": (_stage_full, csv_path),
+            "metrics": (_stage_metrics, n_bars),
+        }
+        run_stage(_warm_cache, csv_path)
+        for stage in stages:
+            if stage in plan:
+                func, arg = plan[stage]
+                record(size, n_bars, run_stage(func, arg))
+
+        if "multi" not in stages:
+            continue
+        for n_symbols in symbol_counts:
+            if n_symbols < 2:
+                continue
+            universe_dir = os.path.join(data_dir, f"{n_bars}x{n_symbols}")
+            write_universe(universe_dir, n_symbols, n_bars)
+            record(f"{size}|symbols={n_symbols}", n_bars * n_symbols,
+                   run_stage(_stage_multi, universe_dir))
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def run_parity(n_bars=20_000, data_dir="bench_data", log=print):
+    """
+    Checks that the event-driven, precomputed and vectorized paths give
+    the same trades for every bundled strategy, on a random walk and on
+    cent-rounded prices with flat stretches, where averages tie and
+    rounding decides crossovers unless ties are broken consistently.
+    Returns the list of failures (empty when every path agrees).
+    """
+    from engine import check_parity, run_backtest
+
+    cases = {
+        "random_walk": write_synthetic_csv(
+            os.path.join(data_dir, f"{n_bars}x1", "SYM000.csv"), n_bars),
+        "cent_ticks": write_synthetic_csv(
+            os.path.join(data_dir, f"{n_bars}x1_cents", "SYM000.csv"), n_bars, tick=0.01),
+    }
+
+    failures = []
+    for case, csv_path in cases.items():
+        for name in STRATEGIES:
+            strategy_class = _strategy_class(name)
+            report = check_parity(strategy_class, "BENCH", csv_path, 100000)
+            problems = list(report["divergences"])
+
+            _, event_trades, _ = run_backtest(strategy_class, "BENCH", csv_path, 100000)
+            _, precomputed_trades, _ = run_backtest(strategy_class, "BENCH", csv_path, 100000,
+                                                    precompute=True)
+            if precomputed_trades != event_trades:
+                problems.append(f"precompute: {len(precomputed_trades)} trades, "
+                                f"event {len(event_trades)}")
+
+            log(f"{name:30s} {case:12s} {report['event_trades']:7d} trades "
+                f"{'ok' if not problems else 'DIVERGES'}")
+            failures.extend(f"{name} on {case}: {problem}" for problem in problems)
+
+    return failures
+
+
+def compare(baseline, current, tolerance=0.10, min_rss_mb=5.0):
+    """
+    Flags stages whose throughput fell, or whose memory growth rose, by
+    more than tolerance relative to the baseline. Memory changes below
+    min_rss_mb are ignored as noise. Returns a list of regression messages.
+    """
+    regressions = []
+
+    for key, base in baseline["results"].items():
+        now = current["results"].get(key)
+        if now is None:
+            continue
+
+        if base.get("throughput") and now.get("throughput"):
+            change = now["throughput"] / base["throughput"] - 1
+            if change < -tolerance:
+                regressions.append(f"{key}: throughput {change:+.1%} "
+                                   f"({base['throughput']:,.0f} -> {now['throughput']:,.0f}/s)")
+
+        grown = now["delta_rss_mb"] - base["delta_rss_mb"]
+        if grown > min_rss_mb and grown > tolerance * max(base["delta_rss_mb"], 0):
+            regressions.append(f"{key}: memory +{grown:.1f} MB "
+                               f"({base['delta_rss_mb']:.1f} -> {now['delta_rss_mb']:.1f} MB)")
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backtester benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite and write a JSON result file")
+    run.add_argument("--bars", type=int, nargs="+", default=[10_000, 100_000],
+                     help="bars per symbol (10k .. 50M)")
+    run.add_argument("--symbols", type=int, nargs="+", default=[1],
+                     help="symbols per universe for the multi-symbol merge (1 .. 500)")
+    run.add_argument("--stages", nargs="+", default=DEFAULT_STAGES, choices=DEFAULT_STAGES)
+    run.add_argument("--data-dir", default="bench_data")
+    run.add_argument("--out", default="bench_results.json")
+
+    cmp = commands.add_parser("compare", help="compare a result file against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--tolerance", type=float, default=0.10)
+
+    parity = commands.add_parser("parity", help="check the event, precomputed and vectorized "
+                                                "paths agree on every bundled strategy")
+    parity.add_argument("--bars", type=int, default=20_000)
+    parity.add_argument("--data-dir", default="bench_data")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "parity":
+        failures = run_parity(args.bars, args.data_dir)
+        for line in failures:
+            print(f"DIVERGENCE {line}")
+        return 1 if failures else 0
+
+    if args.command == "run":
+        report = run_suite(args.bars, args.symbols, args.data_dir, args.stages)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"wrote {args.out}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print(f"no regressions beyond {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
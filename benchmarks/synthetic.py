@@ -0,0 +1,73 @@
+# benchmarks/synthetic.py
+
+import os
+import numpy as np
+import pandas as pd
+
+
+def generate_ohlcv(n_bars, seed=0, start="2000-01-03", freq="min", start_price=100.0,
+                   tick=None):
+    """
+    Geometric random-walk OHLCV bars with consistent high/low ranges.
+    With tick (e.g. 0.01) prices are rounded to it, which gives repeated
+    closes and flat stretches where moving averages tie.
+    """
+    rng = np.random.default_rng(seed)
+
+    closes = start_price * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    opens = np.concatenate(([start_price], closes[:-1]))
+    spread = np.abs(rng.normal(0, 0.0005, n_bars)) * closes
+    highs = np.maximum(opens, closes) + spread
+    lows = np.minimum(opens, closes) - spread
+
+    if tick:
+        opens, highs, lows, closes = (
+            np.round(prices / tick) * tick for prices in (opens, highs, lows, closes)
+        )
+
+    return pd.DataFrame({
+        "Date": pd.date_range(start, periods=n_bars, freq=freq),
+        "Open": opens,
+        "High": highs,
+        "Low": lows,
+        "Close": closes,
+        "Volume": rng.integers(1_000, 100_000, n_bars),
+    })
+
+
+def write_synthetic_csv(path, n_bars, seed=0, chunk_bars=1_000_000, tick=None):
+    """
+    Writes n_bars synthetic bars to path, generated chunk by chunk so the
+    file can be far larger than memory. Existing files are reused.
+    """
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    start = pd.Timestamp("2000-01-03")
+    price = 100.0
+
+    with open(tmp_path, "w") as f:
+        for n, offset in enumerate(range(0, n_bars, chunk_bars)):
+            size = min(chunk_bars, n_bars - offset)
+            chunk = generate_ohlcv(size, seed=seed * 100_003 + n, start=start, start_price=price,
+                                   tick=tick)
+            chunk.to_csv(f, index=False, header=(offset == 0))
+            start = chunk["Date"].iloc[-1] + pd.Timedelta(minutes=1)
+            price = chunk["Close"].iloc[-1]
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_universe(directory, n_symbols, n_bars):
+    """
+    Writes one synthetic CSV per symbol (SYM000.csv, ...) into directory.
+    """
+    return {
+        f"SYM{i:03d}": write_synthetic_csv(
+            os.path.join(directory, f"SYM{i:03d}.csv"), n_bars, seed=i
+        )
+        for i in range(n_symbols)
+    }
@@ -0,0 +1,148 @@
+# checkpoint.py
+
+import os
+import pickle
+import numpy as np
+
+from data_handler.csv_data_handler import CSVDataHandler
+from engine import connect
+from events.event_bus import EventBus
+from execution.execution import SimulatedExecutionHandler
+from performance.metrics import compute_metrics
+from portfolio.portfolio import Portfolio
+
+
+CHECKPOINT_VERSION = 1
+NAT = np.iinfo(np.int64).min
+
+
+def component_state(component):
+    """
+    Everything a component holds except its event queue.
+    """
+    return {k: v for k, v in vars(component).items() if k != "events"}
+
+
+def restore_state(component, state):
+    vars(component).update(state)
+
+
+def snapshot(config, data, strategy, portfolio, execution):
+    """
+    Captures full engine state: the data cursor (plus the timestamps
+    needed to find it again in a grown file), strategy, portfolio and
+    execution state.
+    """
+    times = data.bars["Date"]
+    processed = times[:data.latest_index]
+    dated = processed[processed != NAT]
+
+    return {
+        "version": CHECKPOINT_VERSION,
+        "config": config,
+        "cursor": data.latest_index,
+        "cursor_time": int(processed[-1]) if len(processed) else None,
+        "last_time": int(dated[-1]) if len(dated) else None,
+        "strategy": component_state(strategy),
+        "portfolio": component_state(portfolio),
+        "execution": component_state(execution),
+    }
+
+
+def save_checkpoint(path, state):
+    """
+    Writes a snapshot atomically, so a crash mid-write keeps the previous one.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"{path}: unsupported checkpoint version {state.get('version')}")
+    return state
+
+
+def resume_index(times, state):
+    """
+    Index of the first bar after the snapshot. Uses the saved cursor when
+    the file's prefix is unchanged (rows only appended); otherwise locates
+    the last processed timestamp.
+    """
+    cursor = state["cursor"]
+    if cursor == 0:
+        return 0
+    if cursor <= len(times) and int(times[cursor - 1]) == state["cursor_time"]:
+        return cursor
+
+    last_time = state["last_time"]
+    dated = times[times != NAT]
+    if last_time is not None:
+        index = int(np.searchsorted(dated, last_time, side="right"))
+        if index and int(dated[index - 1]) == last_time:
+            return index
+
+    raise ValueError("data before the checkpoint has changed; cannot resume")
+
+
+def run_resumable_backtest(strategy_class, symbol, csv_path, initial_capital,
+                           checkpoint_path, checkpoint_every=10_000, strategy_params=None):
+    """
+    run_backtest with snapshots of the full engine state written to
+    checkpoint_path every checkpoint_every bars and at the end.
+
+    If checkpoint_path exists the run resumes from it and processes only
+    the bars after the snapshot: after a crash this finishes the run, and
+    after new bars are appended to the CSV it brings the backtest up to
+    date without replaying history. The snapshot must come from the same
+    strategy, parameters, symbol and capital.
+    """
+    config = {
+        "strategy": f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+        "strategy_params": strategy_params or {},
+        "symbol": symbol,
+        "initial_capital": initial_capital,
+    }
+
+    events = EventBus()
+    data = CSVDataHandler(events, csv_path, symbol)
+    strategy = strategy_class(events, symbol, **(strategy_params or {}))
+    portfolio = Portfolio(events, symbol, initial_capital)
+    execution = SimulatedExecutionHandler(events)
+    connect(events, strategy, portfolio, execution)
+
+    if os.path.exists(checkpoint_path):
+        state = load_checkpoint(checkpoint_path)
+        if state["config"] != config:
+            raise ValueError(f"{checkpoint_path} was written for {state['config']}, not {config}")
+
+        restore_state(strategy, state["strategy"])
+        restore_state(portfolio, state["portfolio"])
+        restore_state(execution, state["execution"])
+        data.latest_index = resume_index(data.bars["Date"], state)
+
+    # undated rows sort last and would sort after any appended bars, so
+    # the final snapshot is taken before them and they replay on resume
+    dated_end = int(np.count_nonzero(data.bars["Date"] != NAT))
+    next_checkpoint = data.latest_index + checkpoint_every
+
+    while data.continue_backtest and data.latest_index < dated_end:
+        data.update_bars()
+        events.dispatch_pending()
+
+        if data.latest_index >= next_checkpoint:
+            save_checkpoint(checkpoint_path, snapshot(config, data, strategy, portfolio, execution))
+            next_checkpoint = data.latest_index + checkpoint_every
+
+    save_checkpoint(checkpoint_path, snapshot(config, data, strategy, portfolio, execution))
+
+    while data.continue_backtest:
+        data.update_bars()
+        events.dispatch_pending()
+
+    metrics = compute_metrics(portfolio.holdings_history)
+    return portfolio.holdings_history, portfolio.trades, metrics
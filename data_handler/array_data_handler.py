@@ -0,0 +1,166 @@
+# data_handler/array_data_handler.py
+
+import numpy as np
+import pandas as pd
+from events.events import MarketEvent, MarketBarView
+from indicators.vectorized import INDICATORS
+
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+BAR_COLUMNS = ["Date"] + PRICE_COLUMNS
+
+
+def frame_to_bars(df):
+    """
+    Converts a Date/OHLCV DataFrame into contiguous NumPy columns.
+    Dates become int64 nanoseconds since epoch (NaT -> int64 min),
+    prices and volume become float64.
+    """
+    dates = df["Date"].to_numpy(dtype="datetime64[ns]").view("int64")
+    bars = {"Date": np.ascontiguousarray(dates)}
+
+    for col in PRICE_COLUMNS:
+        values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64")
+        bars[col] = np.ascontiguousarray(values)
+
+    return bars
+
+
+class LookaheadError(IndexError):
+    """
+    Raised when a precomputed column is read past the current bar.
+    """
+
+
+class CausalColumn:
+    """
+    A precomputed indicator column that only exposes bars the data handler
+    has already emitted: value is the current bar's entry, and explicit
+    lookups beyond it raise LookaheadError. The underlying array is
+    private; [], ago(), value and history() are the only ways to read it.
+    """
+
+    __slots__ = ("_values", "data")
+
+    def __init__(self, values, data):
+        self._values = values
+        self.data = data
+
+    @property
+    def index(self):
+        return self.data.latest_index - 1
+
+    @property
+    def value(self):
+        i = self.data.latest_index - 1
+        return self._values[i] if i >= 0 else np.nan
+
+    @property
+    def ready(self):
+        value = self.value
+        return value == value
+
+    def recompute(self):
+        # precomputed columns already hold the np.mean-based values
+        return self.value
+
+    def __getitem__(self, i):
+        current = self.data.latest_index - 1
+        if i < 0 or i > current:
+            raise LookaheadError(f"bar {i} is not available at bar {current}")
+        return self._values[i]
+
+    def ago(self, n):
+        """
+        Value n bars before the current one.
+        """
+        return self[self.data.latest_index - 1 - n]
+
+    def history(self):
+        """
+        Read-only view of every value up to and including the current bar.
+        """
+        view = self._values[:self.data.latest_index]
+        view.flags.writeable = False
+        return view
+
+
+class ArrayDataHandler:
+    """
+    Generates MarketEvents one bar at a time from columnar NumPy arrays.
+
+    With flyweight=True each bar is emitted as a MarketBarView that
+    indexes into the arrays rather than a MarketEvent holding copies.
+    """
+
+    def __init__(self, events, symbol, bars, flyweight=False):
+        self.events = events
+        self.symbol = symbol
+        self.flyweight = flyweight
+
+        self.latest_index = 0
+        self.continue_backtest = True
+
+        self.indicator_columns = {}
+        self._bind(bars)
+
+    def __len__(self):
+        return self._length
+
+    def _bind(self, bars):
+        """
+        Points the per-column fast paths at a set of bar arrays.
+        """
+        self.bars = bars
+        self._times = bars["Date"]
+        self._opens = bars["Open"]
+        self._highs = bars["High"]
+        self._lows = bars["Low"]
+        self._closes = bars["Close"]
+        self._volumes = bars["Volume"]
+        self._length = len(self._times)
+        self._columns = (
+            self._times, self._opens, self._highs,
+            self._lows, self._closes, self._volumes,
+        )
+
+    def indicator(self, name, *args, field="close"):
+        """
+        Computes an indicator over the whole file once with array
+        operations (indicators.vectorized.INDICATORS; same specs as
+        IndicatorRegistry) and returns a CausalColumn over it.
+        """
+        spec = (name, args, field)
+        values = self.indicator_columns.get(spec)
+        if values is None:
+            if name not in INDICATORS:
+                raise KeyError(f"no vectorized form of indicator {name!r}")
+            values = INDICATORS[name](self.bars[field.capitalize()], *args)
+            self.indicator_columns[spec] = values
+        return CausalColumn(values, self)
+
+    def _bar_event(self, i):
+        if self.flyweight:
+            return MarketBarView(self.symbol, self._columns, i)
+
+        return MarketEvent(
+            symbol=self.symbol,
+            time=pd.Timestamp(self._times[i]),
+            open=self._opens[i],
+            high=self._highs[i],
+            low=self._lows[i],
+            close=self._closes[i],
+            volume=self._volumes[i],
+        )
+
+    def update_bars(self):
+        """
+        Pushes the next MarketEvent onto the event queue.
+        """
+        i = self.latest_index
+        if i >= self._length:
+            self.continue_backtest = False
+            return
+
+        self.events.put(self._bar_event(i))
+        self.latest_index = i + 1
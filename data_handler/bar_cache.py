@@ -0,0 +1,136 @@
+# data_handler/bar_cache.py
+
+import json
+import os
+import numpy as np
+
+
+CACHE_DIR_NAME = ".bar_cache"
+CACHE_VERSION = 1
+META_FILE = "meta.json"
+
+
+def cache_dir_for(csv_path):
+    """
+    Cache directory for a CSV: <csv dir>/.bar_cache/<csv file name>/
+    """
+    csv_path = os.path.abspath(csv_path)
+    return os.path.join(
+        os.path.dirname(csv_path), CACHE_DIR_NAME, os.path.basename(csv_path)
+    )
+
+
+def fingerprint(csv_path):
+    """
+    Identifies one version of a CSV file by path, size and mtime.
+    """
+    stat = os.stat(csv_path)
+    return {
+        "version": CACHE_VERSION,
+        "path": os.path.abspath(csv_path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def read_bar_cache(csv_path):
+    """
+    Returns memory-mapped bar columns for csv_path, or None when the cache
+    is missing, stale or unreadable.
+    """
+    cache_dir = cache_dir_for(csv_path)
+
+    try:
+        with open(os.path.join(cache_dir, META_FILE)) as f:
+            meta = json.load(f)
+
+        if meta.get("fingerprint") != fingerprint(csv_path):
+            return None
+
+        bars = {}
+        for col in meta["columns"]:
+            array = np.load(os.path.join(cache_dir, f"{col}.npy"), mmap_mode="r")
+            if array.shape != (meta["rows"],):
+                return None
+            bars[col] = array
+
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    return bars
+
+
+def write_bar_cache(csv_path, bars, source_fingerprint):
+    """
+    Writes bar columns as one .npy file per column. Each column is written
+    to a temporary file and renamed over the old one, so handlers that
+    still map the previous version keep reading it (a new inode) instead
+    of a truncated or rewritten file. The metadata file is written last,
+    so an interrupted write is never mistaken for a valid cache. Failures
+    are ignored: the cache is an optimisation, not a requirement.
+    """
+    cache_dir = cache_dir_for(csv_path)
+    meta_path = os.path.join(cache_dir, META_FILE)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        for col, array in bars.items():
+            col_path = os.path.join(cache_dir, f"{col}.npy")
+            tmp_path = f"{col_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    np.save(f, np.asarray(array))
+                os.replace(tmp_path, col_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        meta = {
+            "fingerprint": source_fingerprint,
+            "columns": list(bars),
+            "rows": len(next(iter(bars.values()))),
+        }
+        tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+    except OSError:
+        pass
+
+
+def load_mapped_bars(csv_path, parse):
+    """
+    Like load_bars, but only ever returns the memory-mapped cache: on a
+    miss the CSV is parsed, written to the cache and the parsed arrays are
+    dropped. Returns None when the cache cannot be written.
+    """
+    bars = read_bar_cache(csv_path)
+    if bars is None:
+        source_fingerprint = fingerprint(csv_path)
+        write_bar_cache(csv_path, parse(csv_path), source_fingerprint)
+        bars = read_bar_cache(csv_path)
+    return bars
+
+
+def load_bars(csv_path, parse, use_cache=True):
+    """
+    Loads bar columns for csv_path, memory-mapping the binary cache when it
+    is valid and falling back to parse(csv_path) otherwise.
+    """
+    if not use_cache:
+        return parse(csv_path)
+
+    bars = read_bar_cache(csv_path)
+    if bars is not None:
+        return bars
+
+    # fingerprint before parsing: if the file changes mid-parse the cache
+    # is recorded against the old version and invalidated on the next load
+    source_fingerprint = fingerprint(csv_path)
+    bars = parse(csv_path)
+    write_bar_cache(csv_path, bars, source_fingerprint)
+    return bars
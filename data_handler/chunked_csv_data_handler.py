@@ -0,0 +1,182 @@
+# data_handler/chunked_csv_data_handler.py
+
+import queue
+import threading
+import numpy as np
+import pandas as pd
+from data_handler.array_data_handler import ArrayDataHandler, BAR_COLUMNS, frame_to_bars
+
+
+NAT = np.iinfo(np.int64).min
+_DONE = object()
+
+
+def iter_csv_chunks(csv_path, chunksize):
+    """
+    Yields bar column dicts of at most chunksize rows each.
+    """
+    with pd.read_csv(csv_path, parse_dates=["Date"], chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield frame_to_bars(chunk)
+
+
+def prefetch(iterable, depth=1, poll_seconds=0.1):
+    """
+    Consumes iterable on a background thread, keeping up to depth items
+    ready ahead of the caller. Exceptions are re-raised in the caller.
+
+    Closing the returned generator (explicitly, or by dropping it) stops
+    the worker within poll_seconds, and the worker closes iterable, so an
+    abandoned stream does not leave a blocked thread or an open file.
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item):
+        # False once the consumer has gone away
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=poll_seconds)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((_DONE, None))
+        except Exception as exc:
+            put((None, exc))
+        finally:
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+
+    threading.Thread(target=worker, daemon=True).start()
+
+    try:
+        while True:
+            item, exc = buffer.get()
+            if exc is not None:
+                raise exc
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+        # unblock a worker waiting on a full buffer
+        while True:
+            try:
+                buffer.get_nowait()
+            except queue.Empty:
+                break
+
+
+def _split_undated(bars):
+    """
+    Separates rows whose Date failed to parse from the dated rows.
+    """
+    undated = bars["Date"] == NAT
+    if not undated.any():
+        return bars, None
+
+    dated = {col: values[~undated] for col, values in bars.items()}
+    rest = {col: values[undated] for col, values in bars.items()}
+    return dated, rest
+
+
+def iter_ordered_chunks(csv_path, chunksize):
+    """
+    Yields the dated rows of each chunk, then the undated rows of the
+    whole file as one last chunk (where CSVDataHandler's sort puts them).
+    Raises ValueError as soon as a date goes backwards, within a chunk or
+    across a chunk boundary, since streamed files cannot be sorted.
+    """
+    undated_chunks = []
+    previous = None
+
+    for bars in iter_csv_chunks(csv_path, chunksize):
+        bars, undated = _split_undated(bars)
+        if undated is not None:
+            undated_chunks.append(undated)
+
+        dates = bars["Date"]
+        if not len(dates):
+            continue
+        if not np.all(np.diff(dates) >= 0) or (previous is not None and dates[0] < previous):
+            raise ValueError(f"{csv_path} is not in ascending Date order; "
+                             "sort it or load it whole with CSVDataHandler")
+        previous = dates[-1]
+        yield bars
+
+    if undated_chunks:
+        yield {col: np.concatenate([u[col] for u in undated_chunks]) for col in BAR_COLUMNS}
+
+
+class ChunkedCSVDataHandler(ArrayDataHandler):
+    """
+    Streams a CSV in fixed-size chunks and generates MarketEvents one bar
+    at a time.
+
+    A background thread parses the next chunk while the current one is
+    consumed, so peak memory is bounded by a few chunks regardless of file
+    size. The file must already be in ascending Date order, since it is
+    never held in memory as a whole to be sorted; a ValueError is raised
+    at the first out-of-order date. Rows with unparseable dates are held
+    back and emitted last, as CSVDataHandler's sort does.
+    """
+
+    def __init__(self, events, csv_path, symbol, chunksize=100_000, prefetch_depth=1,
+                 flyweight=False):
+        self.csv_path = csv_path
+        self.chunksize = chunksize
+
+        self._chunks = prefetch(iter_ordered_chunks(csv_path, chunksize), prefetch_depth)
+        self._chunk_start = 0
+
+        super().__init__(events, symbol, self._next_chunk(), flyweight=flyweight)
+
+    def _next_chunk(self):
+        """
+        Returns the next chunk's bars (the held-back undated rows last), or
+        None when nothing is left.
+        """
+        return next(self._chunks, None)
+
+    def close(self):
+        """
+        Stops the prefetch thread and closes the file. Called automatically
+        when the handler is dropped; call it to stop a run early.
+        """
+        self._chunks.close()
+
+    def indicator(self, name, *args, field="close"):
+        raise TypeError("precomputed indicators need the whole file; use CSVDataHandler")
+
+    def _bind(self, bars):
+        if bars is None:
+            bars = {col: np.empty(0, dtype="int64" if col == "Date" else "float64")
+                    for col in BAR_COLUMNS}
+        super()._bind(bars)
+
+    def update_bars(self):
+        """
+        Pushes the next MarketEvent onto the event queue, pulling the next
+        chunk when the current one is used up.
+        """
+        i = self.latest_index - self._chunk_start
+
+        if i >= self._length:
+            bars = self._next_chunk()
+            if bars is None:
+                self.continue_backtest = False
+                return
+            self._bind(bars)
+            self._chunk_start = self.latest_index
+            i = 0
+
+        self.events.put(self._bar_event(i))
+        self.latest_index += 1
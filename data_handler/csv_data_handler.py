@@ -1,56 +1,35 @@
 # data_handler/csv_data_handler.py
 
 import pandas as pd
-from events.events import MarketEvent
+from data_handler.array_data_handler import ArrayDataHandler, frame_to_bars
+from data_handler.bar_cache import load_bars
 
 
-class CSVDataHandler:
+def parse_csv(csv_path):
     """
-    Reads CSV files and generates MarketEvents one bar at a time.
+    Parses a Date/OHLCV CSV into sorted NumPy bar columns.
     """
+    data = pd.read_csv(csv_path, parse_dates=["Date"])
+    data.sort_values("Date", inplace=True)
+    data.reset_index(drop=True, inplace=True)
 
-    def __init__(self, events, csv_path, symbol):
-        self.events = events
-        self.csv_path = csv_path
-        self.symbol = symbol
+    # non-numeric rows (e.g. yfinance ticker header rows) become NaN
+    return frame_to_bars(data)
+
+
+class CSVDataHandler(ArrayDataHandler):
+    """
+    Reads CSV files and generates MarketEvents one bar at a time.
 
-        self.data = None
-        self.latest_index = 0
-        self.continue_backtest = True
+    The file is parsed once and converted into contiguous NumPy arrays,
+    so each bar is served with a handful of array reads. Parsed arrays are
+    cached next to the CSV and memory-mapped on later loads (use_cache).
+    """
 
-        self._load_data()
+    def __init__(self, events, csv_path, symbol, use_cache=True, flyweight=False):
+        self.csv_path = csv_path
+        self.use_cache = use_cache
+        super().__init__(events, symbol, self._load_data(), flyweight=flyweight)
 
     def _load_data(self):
-        
-        self.data = pd.read_csv(self.csv_path, parse_dates=["Date"])
-        self.data.sort_values("Date", inplace=True)
-        self.data.reset_index(drop=True, inplace=True)
-
-# ---- IMPORTANT FIX ----
-        numeric_cols = ["Open", "High", "Low", "Close", "Volume"]
-        for col in numeric_cols:
-            self.data[col] = pd.to_numeric(self.data[col], errors="coerce")
-
-
-    def update_bars(self):
-        """
-        Pushes the next MarketEvent onto the event queue.
-        """
-        if self.latest_index >= len(self.data):
-            self.continue_backtest = False
-            return
-
-        row = self.data.iloc[self.latest_index]
-
-        event = MarketEvent(
-            symbol=self.symbol,
-            time=row["Date"],
-            open=row["Open"],
-            high=row["High"],
-            low=row["Low"],
-            close=row["Close"],
-            volume=row["Volume"],
-        )
-
-        self.events.put(event)
-        self.latest_index += 1
+        return load_bars(self.csv_path, parse_csv, use_cache=self.use_cache)
@@ -0,0 +1,130 @@
+# data_handler/multi_csv_data_handler.py
+
+import heapq
+import os
+import numpy as np
+import pandas as pd
+from events.events import MarketEvent
+from data_handler.array_data_handler import BAR_COLUMNS
+from data_handler.bar_cache import load_mapped_bars
+from data_handler.chunked_csv_data_handler import iter_ordered_chunks
+from data_handler.csv_data_handler import parse_csv
+
+
+NAT = np.iinfo(np.int64).min
+LAST = np.iinfo(np.int64).max
+
+
+def resolve_sources(sources):
+    """
+    Normalises sources into an ordered {symbol: csv_path} dict.
+
+    Accepts a {symbol: path} mapping, a directory (every *.csv inside,
+    symbol = file name without extension) or an iterable of CSV paths.
+    """
+    if isinstance(sources, dict):
+        return dict(sources)
+
+    if isinstance(sources, (str, os.PathLike)) and os.path.isdir(sources):
+        paths = sorted(
+            os.path.join(sources, f) for f in os.listdir(sources)
+            if f.lower().endswith(".csv")
+        )
+    else:
+        paths = list(sources)
+
+    return {os.path.splitext(os.path.basename(p))[0]: p for p in paths}
+
+
+def iter_bar_rows(bars):
+    """
+    Yields (time, open, high, low, close, volume) tuples from bar columns.
+    """
+    return zip(*(bars[col] for col in BAR_COLUMNS))
+
+
+def iter_chunked_rows(csv_path, chunksize):
+    """
+    Bar rows of a date-ordered CSV read chunk by chunk, so only one
+    chunk of the file is in memory at a time.
+    """
+    for bars in iter_ordered_chunks(csv_path, chunksize):
+        yield from iter_bar_rows(bars)
+
+
+class MultiCSVDataHandler:
+    """
+    Reads one CSV per symbol and generates MarketEvents in global
+    timestamp order, one bar at a time.
+
+    Symbols are merged with a heap holding a single pending bar per
+    stream, so no combined DataFrame is ever built, and no stream is held
+    in memory as a whole: with the bar cache enabled each stream reads
+    its memory-mapped cache (built one file at a time on a miss, the
+    parsed arrays dropped once written). With use_cache=False, or when
+    the cache cannot be written, a stream reads its CSV chunksize rows at
+    a time, which requires the file to be in ascending Date order; every
+    open stream holds one chunk, hence the small default. Either way
+    resident memory grows with the number of open streams rather than the
+    total number of bars. Bars sharing a timestamp are emitted in source
+    order.
+    """
+
+    def __init__(self, events, sources, use_cache=True, chunksize=10_000):
+        self.events = events
+        self.sources = resolve_sources(sources)
+        self.symbols = list(self.sources)
+        self.use_cache = use_cache
+        self.chunksize = chunksize
+
+        self.latest_index = 0
+        self.continue_backtest = True
+
+        self._streams = [self._open_stream(path) for path in self.sources.values()]
+        self._heap = []
+        for stream_id in range(len(self._streams)):
+            self._advance(stream_id)
+
+    def _open_stream(self, csv_path):
+        if self.use_cache:
+            bars = load_mapped_bars(csv_path, parse_csv)
+            if bars is not None:
+                return iter_bar_rows(bars)
+        return iter_chunked_rows(csv_path, self.chunksize)
+
+    def _advance(self, stream_id):
+        """
+        Pulls the next bar of one stream onto the heap.
+        """
+        row = next(self._streams[stream_id], None)
+        if row is None:
+            return
+
+        # unparseable dates sort last, as in CSVDataHandler
+        key = LAST if row[0] == NAT else row[0]
+        heapq.heappush(self._heap, (key, stream_id, row))
+
+    def update_bars(self):
+        """
+        Pushes the next MarketEvent (across all symbols) onto the event queue.
+        """
+        if not self._heap:
+            self.continue_backtest = False
+            return
+
+        _, stream_id, row = heapq.heappop(self._heap)
+        time, open_, high, low, close, volume = row
+
+        event = MarketEvent(
+            symbol=self.symbols[stream_id],
+            time=pd.Timestamp(time),
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+        )
+
+        self.events.put(event)
+        self.latest_index += 1
+        self._advance(stream_id)
@@ -0,0 +1,98 @@
+# data_handler/shared_bars.py
+
+from multiprocessing import shared_memory
+import numpy as np
+from data_handler.array_data_handler import ArrayDataHandler
+from data_handler.bar_cache import load_bars
+from data_handler.csv_data_handler import parse_csv
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # before Python 3.13 attaching always registers the block with the
+        # resource tracker. Pool workers share the parent's tracker, where
+        # a second registration of the same name is a no-op, so the block
+        # is still unlinked exactly once, by SharedBars.close().
+        return shared_memory.SharedMemory(name=name)
+
+
+def _views(shm, spec):
+    bars = {}
+    for col, dtype, offset in spec["columns"]:
+        array = np.ndarray((spec["rows"],), dtype=dtype, buffer=shm.buf, offset=offset)
+        array.flags.writeable = False
+        bars[col] = array
+    return bars
+
+
+class SharedBars:
+    """
+    Bar columns copied once into a single shared-memory block.
+
+    The owning (parent) process creates it and passes .spec, a small
+    picklable dict, to workers; workers call attach_shared_bars(spec) and
+    read the same physical pages, so memory stays flat as workers grow.
+    The owner must call close() (or use it as a context manager) to free it.
+    """
+
+    def __init__(self, bars):
+        rows = len(bars["Date"])
+        columns = []
+        offset = 0
+        for col, values in bars.items():
+            dtype = np.asarray(values).dtype
+            columns.append((col, dtype.str, offset))
+            offset += rows * dtype.itemsize
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self.spec = {"name": self._shm.name, "rows": rows, "columns": columns}
+
+        self.bars = _views(self._shm, self.spec)
+        for col, values in bars.items():
+            target = self.bars[col]
+            target.flags.writeable = True
+            target[:] = values
+            target.flags.writeable = False
+
+    @classmethod
+    def from_csv(cls, csv_path, use_cache=True):
+        return cls(load_bars(csv_path, parse_csv, use_cache=use_cache))
+
+    def close(self):
+        """
+        Releases and unlinks the block. Views become invalid afterwards.
+        """
+        if self._shm is None:
+            return
+        self.bars = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def attach_shared_bars(spec):
+    """
+    Attaches to a SharedBars block from another process.
+    Returns (shm, bars); keep shm referenced while the views are in use.
+    """
+    shm = _attach(spec["name"])
+    return shm, _views(shm, spec)
+
+
+class SharedMemoryDataHandler(ArrayDataHandler):
+    """
+    Generates MarketEvents from zero-copy, read-only views of a SharedBars
+    block created by a parent process.
+    """
+
+    def __init__(self, events, spec, symbol, flyweight=False):
+        self._shm, bars = attach_shared_bars(spec)
+        super().__init__(events, symbol, bars, flyweight=flyweight)
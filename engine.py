@@ -1,43 +1,323 @@
-from queue import Queue
-from data_handler.csv_data_handler import CSVDataHandler
+import inspect
+from events.event_bus import EventBus, FanOut
+from events.events import MarketBar, SignalEvent, OrderEvent, FillEvent
+from data_handler.array_data_handler import ArrayDataHandler
+from data_handler.bar_cache import load_bars
+from data_handler.csv_data_handler import CSVDataHandler, parse_csv
+from data_handler.chunked_csv_data_handler import ChunkedCSVDataHandler
+from data_handler.multi_csv_data_handler import MultiCSVDataHandler
+from data_handler.shared_bars import SharedMemoryDataHandler
+from portfolio.multi_asset import MultiAssetPortfolio
 from portfolio.portfolio import Portfolio
+from portfolio.vectorized import simulate_long_flat
 from execution.execution import SimulatedExecutionHandler
+from indicators.registry import IndicatorRegistry, PrecomputedIndicators
 from performance.metrics import compute_metrics
 
-def run_backtest(strategy_class, symbol, csv_path, initial_capital):
 
+def connect(events, strategy, portfolio, execution):
+    """
+    Subscribes one strategy/portfolio/execution stack to an EventBus.
+    MarketBar handlers run in this order on every bar. strategy may be
+    None when signals are put onto the bus from outside.
+    """
+    if strategy is not None:
+        events.subscribe(MarketBar, strategy.calculate_signals)
+    events.subscribe(MarketBar, portfolio.update_market)
+    events.subscribe(MarketBar, execution.update_market)
+    events.subscribe(SignalEvent, portfolio.update_signal)
+    events.subscribe(OrderEvent, execution.execute_order)
+    events.subscribe(FillEvent, portfolio.update_fill)
 
-    events = Queue()
 
-    data = CSVDataHandler(events, csv_path, symbol)
-    strategy = strategy_class(events, symbol)
-    portfolio = Portfolio(events, symbol, initial_capital)
+def _accepts_indicators(strategy_class):
+    try:
+        return "indicators" in inspect.signature(strategy_class).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def run_backtest(strategy_class, symbol, csv_path, initial_capital, chunksize=None,
+                 shared_bars=None, strategy_params=None, bars=None, profiler=None,
+                 precompute=False, record_bars=False, flyweight=False):
+    """
+    Runs one strategy over one CSV. Pass chunksize to stream the file in
+    chunks instead of loading it whole (the CSV must be date-ordered),
+    shared_bars (a SharedBars.spec) to read bars already loaded into shared
+    memory by a parent process, or bars (a dict of bar column arrays, e.g.
+    a slice of an already-loaded file); csv_path is ignored in the last
+    two cases. strategy_params are passed to the strategy as keyword
+    arguments. Pass a performance.profiling.Profiler to collect per-handler
+    timings, event counts and bars/second.
+
+    precompute=True gives the strategy (which must take an indicators
+    argument) PrecomputedIndicators: its indicators are computed once at
+    load time with array operations and read bar by bar through causal
+    accessors. Not available with chunksize.
+
+    holdings_history and trades are ColumnarRecorders (to_frame() for a
+    DataFrame). record_bars=True records holdings on every bar rather
+    than only on fills, so metrics use the full equity curve.
+
+    flyweight=True emits each bar as a MarketBarView over the data
+    handler's arrays instead of a MarketEvent holding copies.
+    """
+
+    events = EventBus(profiler)
+
+    if bars is not None:
+        data = ArrayDataHandler(events, symbol, bars, flyweight=flyweight)
+    elif shared_bars is not None:
+        data = SharedMemoryDataHandler(events, shared_bars, symbol, flyweight=flyweight)
+    elif chunksize:
+        data = ChunkedCSVDataHandler(events, csv_path, symbol, chunksize=chunksize,
+                                     flyweight=flyweight)
+    else:
+        data = CSVDataHandler(events, csv_path, symbol, flyweight=flyweight)
+
+    kwargs = dict(strategy_params or {})
+    if precompute:
+        if not _accepts_indicators(strategy_class):
+            raise TypeError(f"{strategy_class.__name__} does not take an indicators argument")
+        kwargs["indicators"] = PrecomputedIndicators(data)
+
+    strategy = strategy_class(events, symbol, **kwargs)
+    portfolio = Portfolio(events, symbol, initial_capital, record_bars=record_bars)
     execution = SimulatedExecutionHandler(events)
+    connect(events, strategy, portfolio, execution)
+
+    update_bars = data.update_bars
+    if profiler is not None:
+        update_bars = profiler.wrap(f"{type(data).__name__}.update_bars", update_bars)
+        profiler.start()
+
+    try:
+        while data.continue_backtest:
+            update_bars()
+            events.dispatch_pending()
+    finally:
+        if isinstance(data, ChunkedCSVDataHandler):
+            # stops the prefetch thread even when a strategy raises
+            data.close()
+
+    if profiler is not None:
+        profiler.stop(bars=data.latest_index)
+
+    metrics = compute_metrics(portfolio.holdings_history)
+
+    return portfolio.holdings_history, portfolio.trades, metrics
+
+
+def _stack_name(strategy_class, params):
+    if not params:
+        return strategy_class.__name__
+    args = ", ".join(f"{k}={v}" for k, v in params.items())
+    return f"{strategy_class.__name__}({args})"
+
+
+def run_fanout_backtest(strategies, symbol, csv_path, initial_capital):
+    """
+    Runs several strategies over one CSV in a single pass over the data.
+
+    strategies is a list of strategy classes or (strategy_class, params)
+    pairs. Each gets its own EventBus, strategy, Portfolio and execution
+    handler; one data handler feeds every MarketEvent to all of them, so
+    the cost is one load and one pass plus one update per strategy.
+    Strategies that take an indicators argument share one
+    IndicatorRegistry, updated once per bar before any of them runs, so
+    an indicator several of them use is computed once.
+    Returns {name: (holdings_history, trades, metrics)}.
+    """
+    indicators = IndicatorRegistry()
+    stacks = {}
+    for entry in strategies:
+        strategy_class, params = entry if isinstance(entry, tuple) else (entry, None)
+        events = EventBus()
+        kwargs = dict(params or {})
+        if _accepts_indicators(strategy_class):
+            kwargs.setdefault("indicators", indicators)
+        strategy = strategy_class(events, symbol, **kwargs)
+        portfolio = Portfolio(events, symbol, initial_capital)
+        execution = SimulatedExecutionHandler(events)
+        connect(events, strategy, portfolio, execution)
+
+        name = _stack_name(strategy_class, params)
+        if name in stacks:
+            name = f"{name} #{len(stacks) + 1}"
+        stacks[name] = (events, portfolio)
+
+    buses = [events for events, _ in stacks.values()]
+    data = CSVDataHandler(FanOut([indicators] + buses), csv_path, symbol)
 
     while data.continue_backtest:
+        data.update_bars()
+        for events in buses:
+            events.dispatch_pending()
+
+    return {
+        name: (portfolio.holdings_history, portfolio.trades,
+               compute_metrics(portfolio.holdings_history))
+        for name, (_, portfolio) in stacks.items()
+    }
+
 
+def run_batched_backtest(batched_class, symbol, csv_path, initial_capital, param_sets):
+    """
+    Evaluates many parameter sets of a batched strategy (e.g.
+    strategy.batched_ma_crossover.BatchedMovingAverageCross) in one pass.
+
+    A single strategy instance updates every combination per bar with
+    array operations. Each parameter set gets its own EventBus, Portfolio
+    and execution handler, which only receive events on bars where that
+    combination signals. Returns {name: (holdings_history, trades,
+    metrics)} like run_fanout_backtest.
+    """
+    stacks = {}
+    for params in param_sets:
+        events = EventBus()
+        portfolio = Portfolio(events, symbol, initial_capital)
+        execution = SimulatedExecutionHandler(events)
+        connect(events, None, portfolio, execution)
+
+        name = _stack_name(batched_class, params)
+        if name in stacks:
+            name = f"{name} #{len(stacks) + 1}"
+        stacks[name] = (events, portfolio)
+
+    buses = [events for events, _ in stacks.values()]
+    market = EventBus()
+    strategy = batched_class(buses, symbol, param_sets)
+    market.subscribe(MarketBar, strategy.calculate_signals)
+    data = CSVDataHandler(market, csv_path, symbol)
+
+    while data.continue_backtest:
         data.update_bars()
+        market.dispatch_pending()
+        for k in strategy.signalled:
+            buses[k].dispatch_pending()
+        strategy.signalled = ()
 
-        while not events.empty():
+    return {
+        name: (portfolio.holdings_history, portfolio.trades,
+               compute_metrics(portfolio.holdings_history))
+        for name, (_, portfolio) in stacks.items()
+    }
 
-            event = events.get()
 
-            if event.__class__.__name__ == "MarketEvent":
-                strategy.calculate_signals(event)
-                portfolio.update_market(event)
-                execution.update_market(event)
+class StrategyRouter:
+    """
+    Hands each MarketEvent to the strategy instance for its symbol, so a
+    universe costs one handler call per bar rather than one per symbol.
+    """
 
-            elif event.__class__.__name__ == "SignalEvent":
-                portfolio.update_signal(event)
+    def __init__(self, strategies):
+        self.strategies = strategies
 
-            elif event.__class__.__name__ == "OrderEvent":
-                execution.execute_order(event)
+    def calculate_signals(self, event):
+        strategy = self.strategies.get(event.symbol)
+        if strategy is not None:
+            strategy.calculate_signals(event)
 
-            elif event.__class__.__name__ == "FillEvent":
-                portfolio.update_fill(event)
 
-    metrics = compute_metrics(portfolio.holdings_history)
+def run_multi_asset_backtest(strategy_class, sources, initial_capital,
+                             strategy_params=None, allocation=None):
+    """
+    Runs one strategy instance per symbol over a universe of CSVs (any
+    sources MultiCSVDataHandler accepts), merged in timestamp order, with
+    a single MultiAssetPortfolio holding every position.
+    Returns (holdings_history, trades, metrics); holdings are recorded
+    once per timestamp.
+    """
+    events = EventBus()
+    data = MultiCSVDataHandler(events, sources)
+
+    indicators = IndicatorRegistry()
+    strategies = {}
+    for symbol in data.symbols:
+        kwargs = dict(strategy_params or {})
+        if _accepts_indicators(strategy_class):
+            kwargs.setdefault("indicators", indicators)
+        strategies[symbol] = strategy_class(events, symbol, **kwargs)
 
+    portfolio = MultiAssetPortfolio(events, data.symbols, initial_capital, allocation)
+    execution = SimulatedExecutionHandler(events)
+    events.subscribe(MarketBar, indicators.update)
+    connect(events, StrategyRouter(strategies), portfolio, execution)
+
+    while data.continue_backtest:
+        data.update_bars()
+        events.dispatch_pending()
+    portfolio.flush()
+
+    metrics = compute_metrics(portfolio.holdings_history)
     return portfolio.holdings_history, portfolio.trades, metrics
 
 
+def run_vectorized_backtest(strategy_class, symbol, csv_path, initial_capital,
+                            strategy_params=None):
+    """
+    Fast path for long/flat strategies that implement generate_positions:
+    signals for the whole file are computed with array operations and
+    filled by the vectorized portfolio simulator.
+    Returns (holdings_history, trades, metrics, equity) where equity is the
+    per-bar portfolio value.
+    """
+    strategy = strategy_class(None, symbol, **(strategy_params or {}))
+    if not hasattr(strategy, "generate_positions"):
+        raise TypeError(f"{strategy_class.__name__} has no vectorized implementation")
+
+    bars = load_bars(csv_path, parse_csv)
+    positions = strategy.generate_positions(bars)
+
+    holdings_history, trades, equity = simulate_long_flat(
+        symbol, bars["Date"], bars["Close"], positions, initial_capital
+    )
+    metrics = compute_metrics(holdings_history)
+
+    return holdings_history, trades, metrics, equity
+
+
+def check_parity(strategy_class, symbol, csv_path, initial_capital, strategy_params=None):
+    """
+    Runs the event-driven and vectorized paths on the same data and
+    reports where they diverge. An empty "divergences" list means the
+    fast path reproduced every trade and the final equity exactly.
+    """
+    event_history, event_trades, _ = run_backtest(
+        strategy_class, symbol, csv_path, initial_capital,
+        strategy_params=strategy_params
+    )
+    fast_history, fast_trades, _, _ = run_vectorized_backtest(
+        strategy_class, symbol, csv_path, initial_capital, strategy_params
+    )
+
+    divergences = []
+
+    for n, (event_trade, fast_trade) in enumerate(zip(event_trades, fast_trades)):
+        if event_trade != fast_trade:
+            divergences.append(
+                f"first differing trade #{n}: event {event_trade}, vectorized {fast_trade}"
+            )
+            break
+
+    if len(event_trades) != len(fast_trades):
+        divergences.append(
+            f"trade count: event {len(event_trades)}, vectorized {len(fast_trades)}"
+        )
+
+    event_final = event_history[-1]["total"] if event_history else initial_capital
+    fast_final = fast_history[-1]["total"] if fast_history else initial_capital
+    if event_final != fast_final:
+        divergences.append(f"final equity: event {event_final}, vectorized {fast_final}")
+
+    return {
+        "strategy": strategy_class.__name__,
+        "symbol": symbol,
+        "event_trades": len(event_trades),
+        "vectorized_trades": len(fast_trades),
+        "event_final_equity": event_final,
+        "vectorized_final_equity": fast_final,
+        "divergences": divergences,
+    }
+
+
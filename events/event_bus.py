@@ -0,0 +1,89 @@
+# events/event_bus.py
+
+from collections import deque
+
+
+class EventBus:
+    """
+    Single-threaded FIFO event queue with type-keyed dispatch.
+
+    Handlers subscribe once per event type and are called in subscription
+    order. Dispatch is a dict lookup on type(event); subclasses of a
+    subscribed type resolve to the nearest subscribed base class.
+    put/get/empty mirror queue.Queue, so components that only call
+    events.put(...) work unchanged. There is no locking: use one bus per
+    thread.
+
+    With a profiler (performance.profiling.Profiler) every handler is
+    wrapped with a timer at subscription and puts are counted by type;
+    without one, dispatch is untouched.
+    """
+
+    def __init__(self, profiler=None):
+        self._queue = deque()
+        self._handlers = {}
+        self._resolved = {}
+        self.profiler = profiler
+
+        # bound once: put() is on the hot path of every component
+        self.put = self._queue.append
+        if profiler is not None:
+            self.put = profiler.count_puts(self._queue.append)
+
+    def subscribe(self, event_type, handler):
+        """
+        Registers handler(event) for event_type and its subclasses.
+        """
+        if self.profiler is not None:
+            handler = self.profiler.wrap_handler(event_type, handler)
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._resolved.clear()
+
+    def _resolve(self, event_type):
+        handlers = ()
+        for base in event_type.__mro__:
+            if base in self._handlers:
+                handlers = tuple(self._handlers[base])
+                break
+        self._resolved[event_type] = handlers
+        return handlers
+
+    def get(self):
+        return self._queue.popleft()
+
+    def empty(self):
+        return not self._queue
+
+    def __len__(self):
+        return len(self._queue)
+
+    def dispatch_pending(self):
+        """
+        Dispatches queued events, including any that handlers enqueue,
+        until the queue is empty.
+        """
+        queue = self._queue
+        resolved = self._resolved
+
+        while queue:
+            event = queue.popleft()
+            event_type = type(event)
+            handlers = resolved.get(event_type)
+            if handlers is None:
+                handlers = self._resolve(event_type)
+            for handler in handlers:
+                handler(event)
+
+
+class FanOut:
+    """
+    Write-only queue that puts every event onto several EventBuses.
+    Lets one data handler feed many independent engine stacks.
+    """
+
+    def __init__(self, buses):
+        self.buses = list(buses)
+
+    def put(self, event):
+        for bus in self.buses:
+            bus.put(event)
@@ -5,17 +5,29 @@
 # They do NOT execute logic.
 from dataclasses import dataclass
 from datetime import datetime
+import pandas as pd
 
 
 class Event:
     """
     Base class for all events.
+    Subclasses are slotted: no per-instance __dict__.
     """
-    pass
+    __slots__ = ()
 
 
-@dataclass
-class MarketEvent(Event):
+class MarketBar(Event):
+    """
+    Base class for one bar of market data (symbol, time, open, high, low,
+    close, volume). MarketEvent stores the fields, MarketBarView reads them
+    from a data handler's arrays; subscribe bar handlers to MarketBar so
+    they receive both.
+    """
+    __slots__ = ()
+
+
+@dataclass(slots=True)
+class MarketEvent(MarketBar):
     """
     Handles the event of receiving new market data.
     """
@@ -28,7 +40,52 @@ class MarketEvent(Event):
     volume: float
 
 
-@dataclass
+class MarketBarView(MarketBar):
+    """
+    Flyweight bar: reads one bar from a data handler's column arrays by
+    index instead of copying the fields, so it holds only the symbol, the
+    shared columns and its index.
+
+    columns is the handler's (time, open, high, low, close, volume) array
+    tuple, shared by every view; time is stored as int64 nanoseconds.
+    """
+    __slots__ = ("symbol", "_columns", "_index")
+
+    def __init__(self, symbol, columns, index):
+        self.symbol = symbol
+        self._columns = columns
+        self._index = index
+
+    @property
+    def time(self):
+        return pd.Timestamp(self._columns[0][self._index])
+
+    @property
+    def open(self):
+        return self._columns[1][self._index]
+
+    @property
+    def high(self):
+        return self._columns[2][self._index]
+
+    @property
+    def low(self):
+        return self._columns[3][self._index]
+
+    @property
+    def close(self):
+        return self._columns[4][self._index]
+
+    @property
+    def volume(self):
+        return self._columns[5][self._index]
+
+    def __repr__(self):
+        return (f"MarketBarView(symbol={self.symbol!r}, time={self.time!r}, "
+                f"close={self.close!r}, index={self._index})")
+
+
+@dataclass(slots=True)
 class SignalEvent(Event):
     """
     Generated by a strategy.
@@ -39,7 +96,7 @@ class SignalEvent(Event):
     strength: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderEvent(Event):
     """
     Generated by the portfolio.
@@ -50,7 +107,7 @@ class OrderEvent(Event):
     direction: str     # 'BUY' or 'SELL'
 
 
-@dataclass
+@dataclass(slots=True)
 class FillEvent(Event):
     """
     Generated by the execution handler.
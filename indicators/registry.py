@@ -0,0 +1,98 @@
+# indicators/registry.py
+
+from events.events import MarketBar
+from indicators.streaming import (
+    EMA, SMA, History, RollingMax, RollingMin, RollingStd, SimpleRSI, WilderRSI
+)
+
+
+INDICATORS = {
+    "sma": SMA,
+    "ema": EMA,
+    "max": RollingMax,
+    "min": RollingMin,
+    "std": RollingStd,
+    "rsi": SimpleRSI,
+    "wilder_rsi": WilderRSI,
+}
+
+# indicators over a window of their input, which read it from a History
+WINDOWED = {"sma", "max", "min", "std"}
+
+
+class IndicatorRegistry:
+    """
+    Per-symbol streaming indicators shared by every consumer.
+
+    Strategies request indicators by spec, e.g. get("AAPL", "sma", 20) for
+    SMA(20) on close, and read .value / .ready from the returned object.
+    Equal specs return the same instance, so each distinct indicator is
+    updated once per bar however many strategies use it. Window indicators
+    (SMA, max, min, std) on the same symbol and field all read one History
+    sized to the largest window, so SMA(20), SMA(50) and MAX(20) hold 51
+    closes between them rather than 90. The registry is fed with
+    update(event) (or put(), so it can sit in a FanOut ahead of the
+    strategies' buses); consumers must not update shared indicators
+    themselves.
+    """
+
+    def __init__(self):
+        self.symbols = {}
+        self.histories = {}
+
+    def get(self, symbol, name, *args, field="close"):
+        indicators = self.symbols.setdefault(symbol, {})
+        spec = (name, args, field)
+
+        indicator = indicators.get(spec)
+        if indicator is None:
+            if name in WINDOWED:
+                histories = self.histories.setdefault(symbol, {})
+                history = histories.setdefault(field, History(1))
+                indicator = INDICATORS[name](*args, history=history)
+                history.reserve(indicator.window + 1)
+            else:
+                indicator = INDICATORS[name](*args)
+            indicators[spec] = indicator
+        return indicator
+
+    def update(self, event):
+        indicators = self.symbols.get(event.symbol)
+        if indicators:
+            histories = self.histories.get(event.symbol)
+            if histories:
+                for field, history in histories.items():
+                    history.append(getattr(event, field))
+            for (_, _, field), indicator in indicators.items():
+                indicator.update(getattr(event, field))
+
+    def put(self, event):
+        if isinstance(event, MarketBar):
+            self.update(event)
+
+    def __len__(self):
+        return sum(len(indicators) for indicators in self.symbols.values())
+
+
+class PrecomputedIndicators:
+    """
+    IndicatorRegistry interface over one data handler's precomputed
+    columns: get() computes the whole column at load time and returns a
+    CausalColumn, which reads the current bar's value from the handler's
+    cursor, so nothing needs updating per bar and nothing past the
+    current bar is reachable.
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+    def get(self, symbol, name, *args, field="close"):
+        if symbol != self.data.symbol:
+            raise KeyError(f"data handler serves {self.data.symbol}, not {symbol}")
+        return self.data.indicator(name, *args, field=field)
+
+    def update(self, event):
+        pass
+
+    def put(self, event):
+        pass
@@ -0,0 +1,416 @@
+# indicators/streaming.py
+
+import math
+import operator
+from collections import deque
+
+import numpy as np
+
+
+NAN = float("nan")
+# running sums drift from a fresh np.mean by up to ~window ulps between
+# re-sums; anything this close is a near-tie (see nearly_equal)
+TIE_TOLERANCE = 1e-9
+
+
+def nearly_equal(a, b, rel=TIE_TOLERANCE):
+    """
+    True when a and b are within rounding error of each other, i.e. when
+    comparing running values could order them differently from np.mean.
+    Strategies then compare recompute() values instead, so every path
+    (streaming, precomputed, vectorized) breaks ties identically. False if
+    either is NaN.
+    """
+    return abs(a - b) <= rel * max(abs(a), abs(b))
+
+
+class History:
+    """
+    Ring buffer of the latest capacity values of one series.
+
+    Window indicators read their window from a History instead of keeping
+    a copy of it, so indicators over the same series can share one buffer
+    sized to the largest window (see IndicatorRegistry). The buffer is
+    appended to by its owner, before the indicators reading it update.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.buffer = [NAN] * capacity
+        self.count = 0
+
+    def append(self, value):
+        self.buffer[self.count % self.capacity] = value
+        self.count += 1
+
+    def ago(self, bars):
+        """
+        The value appended bars appends ago (0 is the latest).
+        """
+        return self.buffer[(self.count - 1 - bars) % self.capacity]
+
+    def last(self, n):
+        """
+        The last n values, oldest first.
+        """
+        if n <= 0:
+            return []
+        end = self.count % self.capacity
+        start = (self.count - n) % self.capacity
+        if start < end:
+            return self.buffer[start:end]
+        return self.buffer[start:] + self.buffer[:end]
+
+    def reserve(self, capacity):
+        """
+        Grows the buffer to hold at least capacity values, keeping the
+        values it holds.
+        """
+        if capacity <= self.capacity:
+            return
+        kept = self.last(min(self.count, self.capacity))
+        buffer = [NAN] * capacity
+        for i, value in enumerate(kept, self.count - len(kept)):
+            buffer[i % capacity] = value
+        self.buffer = buffer
+        self.capacity = capacity
+
+
+class _Windowed:
+    """
+    Base for indicators over the last window values of a series. They read
+    the series from history, or from a History of their own when none is
+    given, in which case update() appends to it. A shared history must be
+    appended to before update() is called with the same value, and must
+    hold at least window + 1 values (the window and the value leaving it).
+    """
+
+    def __init__(self, window, history=None):
+        self.window = window
+        self.owns_history = history is None
+        self.history = History(window + 1) if history is None else history
+        self.count = 0
+
+    @property
+    def values(self):
+        """
+        The values in the current window, oldest first.
+        """
+        return self.history.last(min(self.count, self.window))
+
+
+class RollingSum(_Windowed):
+    """
+    Sum of the last window values, updated in O(1) per value.
+
+    Like np.sum, the result is NaN while a NaN is inside the window. The
+    running total is re-summed exactly (math.fsum) once per window of
+    updates, so rounding error cannot build up over long series, and it is
+    exactly 0.0 whenever every value in the window is zero.
+    """
+
+    def __init__(self, window, history=None):
+        super().__init__(window, history)
+        self.total = 0.0
+        self.nans = 0
+        self.nonzero = 0
+        self._since_resum = 0
+
+    def update(self, value):
+        if self.owns_history:
+            self.history.append(value)
+        self.count += 1
+
+        self._add(value)
+        if self.count > self.window:
+            history = self.history
+            self._remove(history.buffer[(history.count - 1 - self.window) % history.capacity])
+
+        self._since_resum += 1
+        if self._since_resum >= self.window:
+            self.total = math.fsum(v for v in self.values if v == v)
+            self._since_resum = 0
+        elif not self.nonzero:
+            self.total = 0.0
+
+        return self.value
+
+    def _add(self, value):
+        if value != value:
+            self.nans += 1
+        elif value:
+            self.total += value
+            self.nonzero += 1
+
+    def _remove(self, value):
+        if value != value:
+            self.nans -= 1
+        elif value:
+            self.total -= value
+            self.nonzero -= 1
+
+    @property
+    def ready(self):
+        return self.count >= self.window
+
+    @property
+    def value(self):
+        return NAN if self.nans else self.total
+
+
+class SMA:
+    """
+    Simple moving average over the last window values. NaN until the
+    window is full.
+    """
+
+    def __init__(self, window, history=None):
+        self.window = window
+        self.sum = RollingSum(window, history)
+
+    def update(self, value):
+        self.sum.update(value)
+        return self.value
+
+    @property
+    def ready(self):
+        return self.sum.ready
+
+    @property
+    def value(self):
+        return self.sum.value / self.window if self.sum.ready else NAN
+
+    def recompute(self):
+        """
+        The average recomputed with np.mean over the window, as
+        indicators.vectorized.rolling_mean computes it.
+        """
+        return float(np.mean(self.sum.values)) if self.sum.ready else NAN
+
+
+class EMA:
+    """
+    Exponential moving average with alpha = 2 / (span + 1), seeded with
+    the first value (pandas ewm(span, adjust=False)).
+    """
+
+    def __init__(self, span=None, alpha=None):
+        if alpha is None:
+            alpha = 2 / (span + 1)
+        self.alpha = alpha
+        self.value = NAN
+
+    def update(self, value):
+        if self.value != self.value:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    @property
+    def ready(self):
+        return self.value == self.value
+
+
+class _RollingExtreme(_Windowed):
+    """
+    Monotonic-deque rolling extreme: candidates holds the indexes of values
+    that can still become the extreme, best first, so every value is pushed
+    and popped at most once (amortized O(1)). The values themselves are
+    read from the history.
+    """
+
+    _dominates = None
+
+    def __init__(self, window, history=None):
+        super().__init__(window, history)
+        self.candidates = deque()
+        self.last_nan = -1
+
+    def update(self, value):
+        if self.owns_history:
+            self.history.append(value)
+        index = self.count
+        self.count += 1
+
+        if value != value:
+            self.last_nan = index
+        else:
+            candidates = self.candidates
+            buffer, capacity = self.history.buffer, self.history.capacity
+            # index i was appended at history.count - 1 - (index - i)
+            offset = self.history.count - 1 - index
+            while candidates and self._dominates(value, buffer[(candidates[-1] + offset) % capacity]):
+                candidates.pop()
+            candidates.append(index)
+
+        while self.candidates and self.candidates[0] <= index - self.window:
+            self.candidates.popleft()
+
+        return self.value
+
+    @property
+    def ready(self):
+        return self.count >= self.window
+
+    @property
+    def value(self):
+        if not self.ready or self.last_nan > self.count - 1 - self.window:
+            return NAN
+        history = self.history
+        return history.buffer[(history.count - self.count + self.candidates[0]) % history.capacity]
+
+
+class RollingMax(_RollingExtreme):
+    """
+    Highest of the last window values (NaN while a NaN is in the window).
+    """
+
+    _dominates = staticmethod(operator.ge)
+
+
+class RollingMin(_RollingExtreme):
+    """
+    Lowest of the last window values (NaN while a NaN is in the window).
+    """
+
+    _dominates = staticmethod(operator.le)
+
+
+class RollingStd(_Windowed):
+    """
+    Standard deviation of the last window values (ddof=0, like np.std),
+    using a sliding Welford update. Mean and sum of squared deviations are
+    recomputed exactly once per window of updates. Expects finite values.
+    """
+
+    def __init__(self, window, ddof=0, history=None):
+        super().__init__(window, history)
+        self.ddof = ddof
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._since_resum = 0
+
+    def update(self, value):
+        if self.owns_history:
+            self.history.append(value)
+        self.count += 1
+
+        if self.count > self.window:
+            old = self.history.ago(self.window)
+            old_mean = self.mean
+            self.mean += (value - old) / self.window
+            self.m2 += (value - old) * (value - self.mean + old - old_mean)
+        else:
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (value - self.mean)
+
+        self._since_resum += 1
+        if self._since_resum >= self.window:
+            values = self.values
+            self.mean = math.fsum(values) / len(values)
+            self.m2 = math.fsum((v - self.mean) ** 2 for v in values)
+            self._since_resum = 0
+
+        return self.value
+
+    @property
+    def ready(self):
+        return self.count >= self.window
+
+    @property
+    def value(self):
+        if not self.ready or self.window <= self.ddof:
+            return NAN
+        return math.sqrt(max(self.m2, 0.0) / (self.window - self.ddof))
+
+
+def _rsi(avg_gain, avg_loss):
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+class SimpleRSI:
+    """
+    RSI from simple averages of the last period gains and losses, as
+    RSIReversionStrategy has always computed it (indicators.vectorized
+    .rolling_rsi). NaN until period + 1 closes were seen, and when there
+    were no losses in the window. Like np.where, a NaN change counts as
+    neither gain nor loss.
+    """
+
+    def __init__(self, period=14):
+        self.period = period
+        self.gains = RollingSum(period)
+        self.losses = RollingSum(period)
+        self.previous = None
+
+    def update(self, close):
+        if self.previous is not None:
+            delta = close - self.previous
+            self.gains.update(delta if delta > 0 else 0.0)
+            self.losses.update(-delta if delta < 0 else 0.0)
+        self.previous = close
+        return self.value
+
+    @property
+    def ready(self):
+        return self.losses.ready
+
+    @property
+    def value(self):
+        if not self.ready or self.losses.total == 0:
+            return NAN
+        return _rsi(self.gains.total, self.losses.total)
+
+    def recompute(self):
+        """
+        The RSI recomputed from np.mean of the window's gains and losses,
+        as indicators.vectorized.rolling_rsi computes it.
+        """
+        if not self.ready or self.losses.total == 0:
+            return NAN
+        return _rsi(float(np.mean(self.gains.values)), float(np.mean(self.losses.values)))
+
+
+class WilderRSI:
+    """
+    Wilder's RSI: averages seeded with the simple mean of the first period
+    changes, then smoothed as avg = (avg * (period - 1) + x) / period.
+    100 when there were no losses.
+    """
+
+    def __init__(self, period=14):
+        self.period = period
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.changes = 0
+        self.previous = None
+
+    def update(self, close):
+        if self.previous is not None:
+            delta = close - self.previous
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+
+            self.changes += 1
+            if self.changes <= self.period:
+                self.avg_gain += gain / self.period
+                self.avg_loss += loss / self.period
+            else:
+                self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+                self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+        self.previous = close
+        return self.value
+
+    @property
+    def ready(self):
+        return self.changes >= self.period
+
+    @property
+    def value(self):
+        if not self.ready:
+            return NAN
+        if self.avg_loss == 0:
+            return 100.0
+        return _rsi(self.avg_gain, self.avg_loss)
@@ -0,0 +1,73 @@
+# indicators/vectorized.py
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _rolling(values, window, reduce):
+    """
+    Applies reduce over each trailing window; out[i] covers
+    values[i - window + 1 : i + 1] and is NaN until the window is full.
+    """
+    values = np.asarray(values, dtype="float64")
+    out = np.full(len(values), np.nan)
+    if 0 < window <= len(values):
+        out[window - 1:] = reduce(sliding_window_view(values, window), axis=1)
+    return out
+
+
+def rolling_mean(values, window):
+    return _rolling(values, window, np.mean)
+
+
+def rolling_max(values, window):
+    return _rolling(values, window, np.max)
+
+
+def rolling_min(values, window):
+    return _rolling(values, window, np.min)
+
+
+def rolling_std(values, window, ddof=0):
+    return _rolling(values, window, lambda windows, axis: np.std(windows, axis=axis, ddof=ddof))
+
+
+def ema(values, span=None, alpha=None):
+    """
+    Exponential moving average seeded with the first value, as
+    indicators.streaming.EMA computes it.
+    """
+    values = pd.Series(np.asarray(values, dtype="float64"))
+    return values.ewm(span=span, alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def rolling_rsi(closes, period):
+    """
+    Simple-average RSI over the trailing period + 1 closes, as computed by
+    RSIReversionStrategy. NaN until the window is full or when there were
+    no losses in the window.
+    """
+    deltas = np.diff(np.asarray(closes, dtype="float64"))
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+
+    # deltas[j] ends at close j + 1, so shift the averages by one bar
+    avg_gain = np.concatenate(([np.nan], rolling_mean(gains, period)))
+    avg_loss = np.concatenate(([np.nan], rolling_mean(losses, period)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    rsi[avg_loss == 0] = np.nan
+    return rsi
+
+
+# whole-array counterparts of indicators.registry.INDICATORS (same specs)
+INDICATORS = {
+    "sma": rolling_mean,
+    "ema": ema,
+    "max": rolling_max,
+    "min": rolling_min,
+    "std": rolling_std,
+    "rsi": rolling_rsi,
+}
@@ -0,0 +1,153 @@
+# live/engine.py
+
+import argparse
+import asyncio
+import time
+import numpy as np
+
+from engine import connect
+from events.event_bus import EventBus
+from events.events import SignalEvent, FillEvent
+from execution.execution import SimulatedExecutionHandler
+from live.sources import socket_bars, tail_csv
+from performance.metrics import compute_metrics
+from portfolio.portfolio import Portfolio
+
+
+def latency_percentiles(samples):
+    """
+    Summarises latency samples (seconds) as microsecond percentiles.
+    """
+    if not samples:
+        return {"count": 0}
+
+    us = np.asarray(samples) * 1e6
+    return {
+        "count": len(us),
+        "p50_us": float(np.percentile(us, 50)),
+        "p90_us": float(np.percentile(us, 90)),
+        "p99_us": float(np.percentile(us, 99)),
+        "max_us": float(us.max()),
+    }
+
+
+class LatencyRecorder:
+    """
+    Timestamps each bar on arrival and stamps signals and fills as they
+    are put on the bus (events.put is wrapped, so create the recorder
+    before the components that put them). bar -> signal is therefore the
+    dispatch of the bar up to the strategy emitting its signal;
+    signal -> fill adds the bar's remaining market handlers, the
+    portfolio's order and the execution handler's fill.
+    """
+
+    def __init__(self, events):
+        self.bar_to_signal = []
+        self.signal_to_fill = []
+        self._bar_time = None
+        self._signal_time = None
+
+        put = events.put
+
+        def timed_put(event):
+            if isinstance(event, SignalEvent):
+                self.on_signal(event)
+            elif isinstance(event, FillEvent):
+                self.on_fill(event)
+            put(event)
+
+        events.put = timed_put
+
+    def on_bar(self):
+        self._bar_time = time.perf_counter()
+
+    def on_signal(self, signal):
+        now = time.perf_counter()
+        self.bar_to_signal.append(now - self._bar_time)
+        self._signal_time = now
+
+    def on_fill(self, fill):
+        if self._signal_time is not None:
+            self.signal_to_fill.append(time.perf_counter() - self._signal_time)
+
+    def report(self):
+        return {
+            "bar_to_signal": latency_percentiles(self.bar_to_signal),
+            "signal_to_fill": latency_percentiles(self.signal_to_fill),
+        }
+
+
+async def run_live(strategy_class, symbol, source, initial_capital=100000,
+                   strategy_params=None, on_fill=None, on_stop=None):
+    """
+    Paper-trades a strategy on an async bar source (see live.sources).
+
+    Uses the same strategy, Portfolio and SimulatedExecutionHandler
+    classes and the same EventBus wiring as run_backtest, so any strategy
+    runs unchanged in both modes. Each bar is dispatched to completion as
+    it arrives; on_fill, if given, is called with every FillEvent.
+    Returns (holdings_history, trades, metrics, latency) once the source
+    ends. If the task is cancelled the cancellation propagates; on_stop,
+    if given, is called with the same tuple however the run stops.
+    """
+    events = EventBus()
+    latency = LatencyRecorder(events)
+
+    strategy = strategy_class(events, symbol, **(strategy_params or {}))
+    portfolio = Portfolio(events, symbol, initial_capital)
+    execution = SimulatedExecutionHandler(events)
+    connect(events, strategy, portfolio, execution)
+    if on_fill:
+        events.subscribe(FillEvent, on_fill)
+
+    try:
+        async for bar in source:
+            latency.on_bar()
+            events.put(bar)
+            events.dispatch_pending()
+    finally:
+        metrics = compute_metrics(portfolio.holdings_history)
+        result = portfolio.holdings_history, portfolio.trades, metrics, latency.report()
+        if on_stop:
+            on_stop(result)
+
+    return result
+
+
+def main(argv=None):
+    from strategy.register import load_strategies
+
+    parser = argparse.ArgumentParser(description="Paper-trade a strategy on a live bar feed")
+    parser.add_argument("strategy", help="strategy class name, e.g. BreakoutStrategy")
+    parser.add_argument("symbol")
+    feed = parser.add_mutually_exclusive_group(required=True)
+    feed.add_argument("--tail", metavar="CSV", help="follow a CSV file as rows are appended")
+    feed.add_argument("--connect", metavar="HOST:PORT", help="read bar lines from a TCP feed")
+    parser.add_argument("--capital", type=float, default=100000)
+    args = parser.parse_args(argv)
+
+    strategy_class = load_strategies()[args.strategy]
+    if args.tail:
+        source = tail_csv(args.tail, args.symbol)
+    else:
+        host, _, port = args.connect.rpartition(":")
+        source = socket_bars(host, int(port), args.symbol)
+
+    def print_fill(fill):
+        print(f"{fill.time} {fill.direction} {fill.quantity} {fill.symbol} @ {fill.fill_price:.2f}",
+              flush=True)
+
+    def print_summary(result):
+        _, _, metrics, latency = result
+        print(metrics)
+        print(latency)
+
+    try:
+        asyncio.run(run_live(strategy_class, args.symbol, source, args.capital,
+                             on_fill=print_fill, on_stop=print_summary))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# live/sources.py
+
+import asyncio
+import csv
+import pandas as pd
+from events.events import MarketEvent
+
+
+FEED_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+def parse_bar_line(line, symbol, columns=FEED_COLUMNS):
+    """
+    Parses one CSV line into a MarketEvent, or returns None for lines that
+    are not a valid bar (headers, blank or non-numeric rows, or columns
+    missing a Date/OHLCV field).
+    """
+    values = next(csv.reader([line.strip()]), None)
+    if not values or len(values) != len(columns):
+        return None
+
+    row = dict(zip(columns, values))
+    try:
+        return MarketEvent(
+            symbol=symbol,
+            time=pd.Timestamp(row["Date"]),
+            open=float(row["Open"]),
+            high=float(row["High"]),
+            low=float(row["Low"]),
+            close=float(row["Close"]),
+            volume=float(row["Volume"]),
+        )
+    except (ValueError, KeyError):
+        return None
+
+
+async def tail_csv(path, symbol, follow=True, poll_interval=0.5):
+    """
+    Yields MarketEvents from a CSV file as lines are appended to it.
+
+    Existing rows are replayed first (which warms up the strategy); with
+    follow=True the file is then polled for new rows forever, otherwise
+    the feed ends at end of file. Partially written lines are held until
+    their newline arrives.
+
+    The first non-blank line is read as a header only if it names a Date
+    column or is not a bar; otherwise the file is taken to be headerless
+    with FEED_COLUMNS order and that line is the first bar.
+    """
+    with open(path, newline="") as f:
+        columns = None
+        pending = ""
+
+        while True:
+            line = f.readline()
+
+            if not line:
+                if not follow:
+                    return
+                await asyncio.sleep(poll_interval)
+                continue
+
+            pending += line
+            if not pending.endswith("\n"):
+                continue
+
+            line, pending = pending, ""
+            if columns is None:
+                if not line.strip():
+                    continue
+                event = parse_bar_line(line, symbol)
+                if event is None or "Date" in line:
+                    columns = [c.strip() for c in line.split(",")]
+                    continue
+                columns = FEED_COLUMNS
+            else:
+                event = parse_bar_line(line, symbol, columns)
+
+            if event is not None:
+                yield event
+
+
+async def socket_bars(host, port, symbol):
+    """
+    Yields MarketEvents from a TCP feed sending one
+    Date,Open,High,Low,Close,Volume line per bar. Ends when the peer
+    closes the connection.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            event = parse_bar_line(line.decode(), symbol)
+            if event is not None:
+                yield event
+    finally:
+        writer.close()
+        await writer.wait_closed()
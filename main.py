@@ -1,13 +1,16 @@
-from queue import Queue
+from events.event_bus import EventBus
+from events.events import MarketBar, SignalEvent
 from data_handler.csv_data_handler import CSVDataHandler
 from strategy.ma_crossover import MovingAverageCrossStrategy
 
-events = Queue()
+events = EventBus()
 
 data = CSVDataHandler(events, "data/sample_data.csv", "TEST")
 strategy = MovingAverageCrossStrategy(events, "TEST", 3, 5)
 
+events.subscribe(MarketBar, strategy.calculate_signals)
+events.subscribe(SignalEvent, print)
+
 while data.continue_backtest:
     data.update_bars()
-    event = events.get()
-    strategy.calculate_signals(event)
+    events.dispatch_pending()
@@ -0,0 +1,87 @@
+# market_data/sources.py
+
+import os
+import pandas as pd
+
+
+OHLCV_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+def normalize_ohlcv(data):
+    """
+    Returns a Date/OHLCV frame with tz-naive dates, sorted by Date.
+    """
+    if isinstance(data.columns, pd.MultiIndex):
+        data.columns = data.columns.get_level_values(0)
+
+    if "Date" not in data.columns:
+        data = data.reset_index()
+        data = data.rename(columns={data.columns[0]: "Date"})
+
+    data = data[OHLCV_COLUMNS].copy()
+    for col in OHLCV_COLUMNS[1:]:
+        data[col] = pd.to_numeric(data[col], errors="coerce")
+
+    dates = pd.to_datetime(data["Date"], errors="coerce")
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    data["Date"] = dates
+
+    data = data.dropna()
+    return data.sort_values("Date").reset_index(drop=True)
+
+
+class MarketDataSource:
+    """
+    Interface for anything that can supply daily OHLCV history.
+    """
+
+    def fetch(self, ticker, start, end):
+        """
+        Returns a Date/OHLCV DataFrame for start <= Date < end.
+        """
+        raise NotImplementedError
+
+
+class YahooFinanceSource(MarketDataSource):
+    """
+    Downloads history from Yahoo Finance. Raises ConnectionError when the
+    download fails: yf.download reports failures (network errors, rate
+    limits, unknown tickers) as an empty frame, which must not be mistaken
+    for a range without bars.
+    """
+
+    def fetch(self, ticker, start, end):
+        import yfinance as yf
+
+        data = yf.download(ticker, start=start, end=end, progress=False)
+        if data.empty:
+            # yfinance records per-ticker download errors here
+            errors = getattr(getattr(yf, "shared", None), "_ERRORS", None) or {}
+            error = errors.get(ticker) or errors.get(ticker.upper())
+            if error:
+                raise ConnectionError(f"Yahoo Finance download failed for {ticker}: {error}")
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return normalize_ohlcv(data)
+
+
+class CSVDirectorySource(MarketDataSource):
+    """
+    Serves history from <directory>/<ticker>.csv files.
+    A local stand-in for network sources (tests, offline runs).
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.calls = []
+
+    def fetch(self, ticker, start, end):
+        self.calls.append((ticker, start, end))
+
+        path = os.path.join(self.directory, f"{ticker}.csv")
+        if not os.path.exists(path):
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+        data = normalize_ohlcv(pd.read_csv(path, parse_dates=["Date"]))
+        in_range = (data["Date"] >= pd.Timestamp(start)) & (data["Date"] < pd.Timestamp(end))
+        return data[in_range].reset_index(drop=True)
@@ -0,0 +1,117 @@
+# market_data/store.py
+
+import json
+import os
+from datetime import date
+import numpy as np
+import pandas as pd
+from market_data.sources import OHLCV_COLUMNS, normalize_ohlcv
+
+
+def merge_ranges(ranges):
+    """
+    Coalesces overlapping or touching [start, end) date ranges.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(r) for r in merged]
+
+
+def missing_ranges(held, start, end):
+    """
+    Returns the parts of [start, end) not covered by the held ranges.
+    """
+    gaps = []
+    cursor = start
+
+    for held_start, held_end in merge_ranges(held):
+        if held_end <= cursor:
+            continue
+        if held_start >= end:
+            break
+        if held_start > cursor:
+            gaps.append((cursor, held_start))
+        cursor = max(cursor, held_end)
+
+    if cursor < end:
+        gaps.append((cursor, end))
+
+    return gaps
+
+
+class LocalMarketDataStore:
+    """
+    Persistent per-ticker history store in front of a MarketDataSource.
+
+    Each ticker keeps <root>/<ticker>.csv plus <ticker>.json listing the
+    [start, end) date ranges already fetched. A range is recorded once the
+    source returned bars for it, or when it holds no weekdays: an empty
+    answer for weekdays may be a failed download, so it is asked for again
+    on the next request (as are ranges holding only holidays).
+    """
+
+    def __init__(self, source, root="data/store"):
+        self.source = source
+        self.root = root
+
+    def _paths(self, ticker):
+        return (
+            os.path.join(self.root, f"{ticker}.csv"),
+            os.path.join(self.root, f"{ticker}.json"),
+        )
+
+    def held_ranges(self, ticker):
+        _, ranges_path = self._paths(ticker)
+        if not os.path.exists(ranges_path):
+            return []
+
+        with open(ranges_path) as f:
+            return [(date.fromisoformat(s), date.fromisoformat(e)) for s, e in json.load(f)]
+
+    def _load(self, ticker):
+        csv_path, _ = self._paths(ticker)
+        if not os.path.exists(csv_path):
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return normalize_ohlcv(pd.read_csv(csv_path, parse_dates=["Date"]))
+
+    def _save(self, ticker, data, ranges):
+        csv_path, ranges_path = self._paths(ticker)
+        os.makedirs(self.root, exist_ok=True)
+
+        data.to_csv(csv_path, index=False)
+        with open(ranges_path, "w") as f:
+            json.dump([[s.isoformat(), e.isoformat()] for s, e in ranges], f)
+
+    def get_history(self, ticker, start, end):
+        """
+        Returns Date/OHLCV bars for start <= Date < end, fetching from the
+        source only the sub-ranges not already held locally.
+        """
+        start, end = pd.Timestamp(start).date(), pd.Timestamp(end).date()
+
+        held = self.held_ranges(ticker)
+        data = self._load(ticker)
+        gaps = missing_ranges(held, start, end)
+
+        if gaps:
+            fetched = [self.source.fetch(ticker, s, e) for s, e in gaps]
+            frames = [f for f in [data] + fetched if not f.empty]
+            if frames:
+                data = pd.concat(frames, ignore_index=True)
+                data = data.drop_duplicates("Date", keep="last")
+                data = data.sort_values("Date").reset_index(drop=True)
+
+            # days from today onwards may still gain bars, so never mark them held
+            today = date.today()
+            fetched_ranges = [
+                (s, min(e, today)) for (s, e), frame in zip(gaps, fetched)
+                if s < today and (not frame.empty or not np.busday_count(s, min(e, today)))
+            ]
+            self._save(ticker, data, merge_ranges(held + fetched_ranges))
+
+        in_range = (data["Date"] >= pd.Timestamp(start)) & (data["Date"] < pd.Timestamp(end))
+        return data[in_range].reset_index(drop=True)
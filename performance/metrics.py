@@ -4,7 +4,8 @@ import numpy as np
 def compute_metrics(history):
 
 
-    df = pd.DataFrame(history)
+    # ColumnarRecorder (zero-copy) or a list of holdings dicts
+    df = history.to_frame() if hasattr(history, "to_frame") else pd.DataFrame(history)
 
     if len(df) < 2:
         return {}
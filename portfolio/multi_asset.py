@@ -0,0 +1,177 @@
+# portfolio/multi_asset.py
+
+import numpy as np
+
+from events.events import OrderEvent
+from portfolio.recorder import TRADE_COLUMNS, ColumnarRecorder, NAT, time_value
+
+
+MULTI_HOLDINGS_COLUMNS = {
+    "time": "datetime64[ns]",
+    "cash": "float64",
+    "holdings": "float64",
+    "exposure": "float64",
+    "total": "float64",
+}
+
+
+class MultiAssetPortfolio:
+    """
+    Portfolio over a universe of symbols. Positions, last prices and
+    average cost bases are NumPy arrays indexed by symbol ID (the order of
+    symbols), so marking to market, exposure and equity are single vector
+    operations however many instruments there are.
+
+    Accepts MarketEvents, SignalEvents and FillEvents for any symbol in
+    the universe. Holdings are recorded once per timestamp, when the first
+    bar of the next timestamp arrives; call flush() after the last bar.
+    LONG buys with at most allocation (default 1 / number of symbols) of
+    current equity, capped by cash; EXIT sells the whole position.
+    """
+
+    def __init__(self, events, symbols, initial_capital=100000, allocation=None):
+        self.events = events
+        self.symbols = list(symbols)
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.initial_capital = initial_capital
+        self.allocation = allocation if allocation is not None else 1 / max(len(self.symbols), 1)
+
+        self.cash = initial_capital
+        self.positions = np.zeros(len(self.symbols), dtype=np.int64)
+        self.prices = np.full(len(self.symbols), np.nan)
+        self.cost_basis = np.zeros(len(self.symbols))
+
+        self.current_time = None
+        self.trades = ColumnarRecorder(TRADE_COLUMNS)
+        self.holdings_history = ColumnarRecorder(MULTI_HOLDINGS_COLUMNS)
+
+    def symbol_id(self, symbol):
+        try:
+            return self.symbol_ids[symbol]
+        except KeyError:
+            raise KeyError(f"{symbol} is not in the portfolio universe") from None
+
+    # ---- VECTOR VALUATION ----
+
+    def market_values(self):
+        """
+        Signed market value per symbol (0 where flat or never priced).
+        """
+        values = self.positions * self.prices
+        values[self.positions == 0] = 0.0
+        return values
+
+    def unrealized_pnl(self):
+        pnl = self.positions * (self.prices - self.cost_basis)
+        pnl[self.positions == 0] = 0.0
+        return pnl
+
+    def exposure(self):
+        """
+        Gross exposure: sum of absolute market values.
+        """
+        return np.abs(self.market_values()).sum()
+
+    def equity(self):
+        return self.cash + self.market_values().sum()
+
+    def weights(self):
+        """
+        Market value per symbol as a fraction of equity.
+        """
+        return self.market_values() / self.equity()
+
+    # ---- EVENT HANDLERS ----
+
+    def update_market(self, event):
+        """
+        Updates the symbol's last price; the first bar of a new timestamp
+        records the previous one.
+        """
+        i = self.symbol_ids.get(event.symbol)
+        if i is None:
+            return
+
+        time = time_value(event.time)
+        if time != self.current_time:
+            self.flush()
+            self.current_time = time
+
+        if event.close == event.close:
+            self.prices[i] = event.close
+
+    def update_signal(self, signal):
+        """
+        Converts SignalEvent into OrderEvent for the signal's symbol.
+        """
+        i = self.symbol_id(signal.symbol)
+
+        if signal.signal_type == "LONG" and self.positions[i] == 0:
+            order = OrderEvent(
+                symbol=signal.symbol,
+                order_type="MKT",
+                quantity=self._calculate_quantity(i),
+                direction="BUY"
+            )
+            self.events.put(order)
+
+        elif signal.signal_type == "EXIT" and self.positions[i] > 0:
+            order = OrderEvent(
+                symbol=signal.symbol,
+                order_type="MKT",
+                quantity=int(self.positions[i]),
+                direction="SELL"
+            )
+            self.events.put(order)
+
+    def update_fill(self, fill):
+        """
+        Updates cash, position and cost basis from FillEvent.
+        """
+        i = self.symbol_id(fill.symbol)
+        position = self.positions[i]
+
+        if fill.direction == "BUY":
+            self.cash -= fill.quantity * fill.fill_price
+            if position + fill.quantity:
+                self.cost_basis[i] = (
+                    (position * self.cost_basis[i] + fill.quantity * fill.fill_price)
+                    / (position + fill.quantity)
+                )
+            self.positions[i] = position + fill.quantity
+
+        elif fill.direction == "SELL":
+            self.cash += fill.quantity * fill.fill_price
+            self.positions[i] = position - fill.quantity
+            if self.positions[i] == 0:
+                self.cost_basis[i] = 0.0
+
+        self.prices[i] = fill.fill_price
+        self.trades.append(
+            time_value(fill.time), fill.symbol, fill.direction,
+            fill.fill_price, fill.quantity, self.cash, self.positions[i]
+        )
+
+    def _calculate_quantity(self, i):
+        """
+        Shares of symbol i worth allocation of equity, capped by cash.
+        """
+        price = self.prices[i]
+        if price != price or price <= 0:
+            return 0
+        budget = min(self.cash, self.equity() * self.allocation)
+        return int(budget / price)
+
+    def flush(self):
+        """
+        Records holdings for the current timestamp (undated bars are not
+        recorded).
+        """
+        if self.current_time is None or self.current_time == NAT:
+            return
+
+        values = self.market_values()
+        holdings = values.sum()
+        self.holdings_history.append(
+            self.current_time, self.cash, holdings, np.abs(values).sum(), self.cash + holdings
+        )
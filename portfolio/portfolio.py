@@ -1,24 +1,33 @@
 # portfolio/portfolio.py
 
 from events.events import OrderEvent
+from portfolio.recorder import (
+    HOLDINGS_COLUMNS, TRADE_COLUMNS, ColumnarRecorder, time_value
+)
 
 
 class Portfolio:
     """
     Handles positions, cash, and order generation.
+
+    holdings_history and trades are ColumnarRecorders. By default holdings
+    are recorded on every fill; with record_bars=True they are recorded on
+    every bar instead (a fill updates its bar's row), giving a full
+    equity curve.
     """
 
-    def __init__(self, events, symbol, initial_capital=100000):
+    def __init__(self, events, symbol, initial_capital=100000, record_bars=False):
         self.events = events
         self.symbol = symbol
         self.initial_capital = initial_capital
-        self.trades = []
+        self.record_bars = record_bars
+        self.trades = ColumnarRecorder(TRADE_COLUMNS)
 
         self.cash = initial_capital
         self.position = 0
         self.current_price = None
 
-        self.holdings_history = []
+        self.holdings_history = ColumnarRecorder(HOLDINGS_COLUMNS)
 
     def update_market(self, event):
         """
@@ -27,6 +36,10 @@ class Portfolio:
         if event.symbol == self.symbol:
             self.current_price = event.close
 
+            # bars without a price are not marked
+            if self.record_bars and event.close == event.close:
+                self._record_holdings(event.time)
+
     def update_signal(self, signal):
         """
         Converts SignalEvent into OrderEvent.
@@ -63,15 +76,10 @@ class Portfolio:
             proceeds = fill.quantity * fill.fill_price
             self.cash += proceeds
             self.position -= fill.quantity
-        self.trades.append({
-"time": fill.time,
-"symbol": fill.symbol,
-"direction": fill.direction,
-"price": fill.fill_price,
-"quantity": fill.quantity,
-"cash_after": self.cash,
-"position_after": self.position
-})
+        self.trades.append(
+            time_value(fill.time), fill.symbol, fill.direction,
+            fill.fill_price, fill.quantity, self.cash, self.position
+        )
         self._record_holdings(fill.time)
 
     def _calculate_quantity(self):
@@ -88,14 +96,14 @@ class Portfolio:
         """
         holdings_value = self.position * self.current_price if self.current_price else 0
         total_value = self.cash + holdings_value
-
-        self.holdings_history.append({
-            "time": time,
-            "cash": self.cash,
-            "position": self.position,
-            "holdings": holdings_value,
-            "total": total_value
-        })
+        row = (time_value(time), self.cash, self.position, holdings_value, total_value)
+
+        history = self.holdings_history
+        # with record_bars a fill replaces the row its bar already recorded
+        if self.record_bars and history and history.last("time") == row[0]:
+            history.replace_last(*row)
+        else:
+            history.append(*row)
 
 
 
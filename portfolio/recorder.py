@@ -0,0 +1,166 @@
+# portfolio/recorder.py
+
+import numpy as np
+import pandas as pd
+
+
+HOLDINGS_COLUMNS = {
+    "time": "datetime64[ns]",
+    "cash": "float64",
+    "position": "int64",
+    "holdings": "float64",
+    "total": "float64",
+}
+
+TRADE_COLUMNS = {
+    "time": "datetime64[ns]",
+    "symbol": "object",
+    "direction": "object",
+    "price": "float64",
+    "quantity": "int64",
+    "cash_after": "float64",
+    "position_after": "int64",
+}
+
+NAT = np.iinfo(np.int64).min
+
+
+def time_value(time):
+    """
+    Nanoseconds since epoch for a Timestamp (or anything pd.Timestamp
+    accepts); NaT and None -> int64 min, as in the bar arrays.
+    """
+    try:
+        value = time.value
+    except AttributeError:
+        value = pd.Timestamp(time).value if time is not None else NAT
+    return NAT if value is None else value
+
+
+class ColumnarRecorder:
+    """
+    Append-only table with one growable NumPy array per column.
+
+    Capacity doubles when full, so appends are amortized O(1) with no
+    per-row dict. to_frame() / arrays() hand out views of the filled part
+    without copying. Rows can still be read like the old list of dicts
+    (len, indexing, iteration, truthiness), so existing consumers keep
+    working. datetime columns are stored as int64 nanoseconds (see
+    time_value) and exposed as datetime64[ns].
+    """
+
+    def __init__(self, columns, capacity=64):
+        self.columns = dict(columns)
+        self._names = tuple(self.columns)
+        self._arrays = {
+            name: np.empty(capacity, dtype=self._storage(dtype))
+            for name, dtype in self.columns.items()
+        }
+        self._length = 0
+
+    @classmethod
+    def from_arrays(cls, columns, arrays):
+        """
+        Recorder holding existing column arrays ({name: array} in column
+        order; datetime columns as int64 nanoseconds or datetime64[ns]),
+        e.g. to build a history in bulk rather than row by row.
+        """
+        recorder = cls.__new__(cls)
+        recorder.__setstate__({"columns": dict(columns), "arrays": arrays})
+        return recorder
+
+    @staticmethod
+    def _storage(dtype):
+        return "int64" if dtype == "datetime64[ns]" else dtype
+
+    def _grow(self):
+        for name, array in self._arrays.items():
+            grown = np.empty(max(2 * len(array), 1), dtype=array.dtype)
+            grown[:self._length] = array[:self._length]
+            self._arrays[name] = grown
+
+    def append(self, *values):
+        """
+        Adds one row; values in column order, times as time_value ints.
+        """
+        i = self._length
+        if i == len(self._arrays[self._names[0]]):
+            self._grow()
+        for name, value in zip(self._names, values):
+            self._arrays[name][i] = value
+        self._length = i + 1
+
+    def replace_last(self, *values):
+        i = self._length - 1
+        for name, value in zip(self._names, values):
+            self._arrays[name][i] = value
+
+    def last(self, name):
+        """
+        Stored value of a column in the last row (times as int64).
+        """
+        return self._arrays[name][self._length - 1]
+
+    def column(self, name):
+        """
+        View of one column's filled rows.
+        """
+        values = self._arrays[name][:self._length]
+        if self.columns[name] == "datetime64[ns]":
+            return values.view("datetime64[ns]")
+        return values
+
+    def arrays(self):
+        return {name: self.column(name) for name in self._names}
+
+    def to_frame(self):
+        return pd.DataFrame(self.arrays(), copy=False)
+
+    def _row(self, i):
+        row = {}
+        for name in self._names:
+            value = self._arrays[name][i]
+            if self.columns[name] == "datetime64[ns]":
+                value = pd.Timestamp(value) if value != NAT else pd.NaT
+            row[name] = value
+        return row
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("recorder index out of range")
+        return self._row(index)
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self._row(i)
+
+    def __eq__(self, other):
+        if isinstance(other, (ColumnarRecorder, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ColumnarRecorder({len(self)} rows: {', '.join(self._names)})"
+
+    def __getstate__(self):
+        # drop unused capacity when pickled (checkpoints, result cache)
+        return {"columns": self.columns, "arrays": self.arrays()}
+
+    def __setstate__(self, state):
+        self.columns = state["columns"]
+        self._names = tuple(self.columns)
+        self._arrays = {
+            name: np.array(values).view(self._storage(self.columns[name]))
+            if self.columns[name] == "datetime64[ns]" else np.array(values)
+            for name, values in state["arrays"].items()
+        }
+        self._length = len(next(iter(self._arrays.values()), ()))
@@ -0,0 +1,79 @@
+# portfolio/vectorized.py
+
+import numpy as np
+
+from portfolio.recorder import HOLDINGS_COLUMNS, TRADE_COLUMNS, ColumnarRecorder
+
+
+def simulate_long_flat(symbol, times, closes, positions, initial_capital=100000):
+    """
+    Vectorized counterpart of Portfolio + SimulatedExecutionHandler for
+    long/flat strategies.
+
+    positions is a strategy's 1/0 in-market array (see generate_positions);
+    each change is a LONG or EXIT signal, filled at that bar's close with
+    Portfolio's all-in sizing. Only signal bars are visited in Python, so
+    the cost follows the number of trades rather than the number of bars.
+
+    Returns (holdings_history, trades, equity): the first two in the same
+    format as Portfolio, equity as a per-bar NumPy array of portfolio value.
+    """
+    signal_bars = np.flatnonzero(np.diff(positions, prepend=0))
+
+    cash = initial_capital
+    position = 0
+    trades = ColumnarRecorder(TRADE_COLUMNS)
+    holdings_history = ColumnarRecorder(HOLDINGS_COLUMNS)
+    fill_bars = []
+
+    for i in signal_bars:
+        price = closes[i]
+
+        if positions[i] == 1 and position == 0:
+            direction = "BUY"
+            quantity = int(cash / price)
+            cash -= quantity * price
+            position += quantity
+
+        elif positions[i] == 0 and position > 0:
+            direction = "SELL"
+            quantity = position
+            cash += quantity * price
+            position -= quantity
+
+        else:
+            continue
+
+        time = times[i]
+        trades.append(time, symbol, direction, price, quantity, cash, position)
+
+        holdings_value = position * price if price else 0
+        holdings_history.append(time, cash, position, holdings_value, cash + holdings_value)
+        fill_bars.append(i)
+
+    equity = _equity_curve(closes, fill_bars, trades, initial_capital)
+    return holdings_history, trades, equity
+
+
+def _equity_curve(closes, fill_bars, trades, initial_capital):
+    """
+    Forward-fills cash and shares from each fill to the next and marks
+    the shares to market on every bar.
+    """
+    n = len(closes)
+    cash = np.full(n, float(initial_capital))
+    shares = np.zeros(n)
+
+    if fill_bars:
+        fill_bars = np.asarray(fill_bars)
+        last_fill = np.full(n, -1)
+        last_fill[fill_bars] = np.arange(len(fill_bars))
+        np.maximum.accumulate(last_fill, out=last_fill)
+
+        filled = last_fill >= 0
+        cash_after = trades.column("cash_after")
+        shares_after = trades.column("position_after").astype("float64")
+        cash[filled] = cash_after[last_fill[filled]]
+        shares[filled] = shares_after[last_fill[filled]]
+
+    return cash + shares * closes
@@ -0,0 +1,128 @@
+# research/batch.py
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+
+from data_handler.multi_csv_data_handler import resolve_sources
+from engine import run_backtest
+
+
+def _run_symbol(strategy_class, symbol, csv_path, initial_capital, strategy_params):
+    """
+    Worker entry point: one backtest for one symbol. Errors are returned,
+    not raised, so one bad file does not stop the batch.
+    """
+    start = time.perf_counter()
+    row = {"symbol": symbol}
+    equity = pd.Series(dtype="float64")
+    try:
+        history, trades, metrics = run_backtest(
+            strategy_class, symbol, csv_path, initial_capital,
+            strategy_params=strategy_params, record_bars=True
+        )
+        row.update(metrics)
+        row["Trades"] = len(trades)
+        row["error"] = None
+        equity = pd.Series(history.column("total"), index=history.column("time"))
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    row["seconds"] = time.perf_counter() - start
+    return row, equity
+
+
+def combine_equity(curves, initial_capital):
+    """
+    Aligns per-symbol equity curves (Series indexed by time) on time,
+    carries each forward (starting from initial_capital) and adds a
+    "combined" column with their sum.
+    """
+    columns = {
+        symbol: curve[~curve.index.duplicated(keep="last")]
+        for symbol, curve in curves.items()
+    }
+    equity = pd.DataFrame(columns).sort_index()
+    equity = equity[equity.index.notna()].ffill().fillna(initial_capital)
+    equity["combined"] = equity.sum(axis=1)
+    equity.index.name = "time"
+    return equity
+
+
+def run_batch(strategy_class, data_dir, initial_capital=100000, strategy_params=None,
+              workers=None, out_dir=None, progress=None):
+    """
+    Backtests one strategy on every CSV in data_dir across a process pool.
+
+    Files are submitted largest first so long runs start early and small
+    ones fill the gaps (longest-processing-time scheduling). progress, if
+    given, is called as progress(done, total, row) when each symbol ends.
+    Returns (metrics, equity): a per-symbol table with metrics, trade
+    count, file size, run time and error, and the combined equity curve.
+    Both are written to out_dir as metrics.csv / equity.csv when given.
+    Every run records holdings on each bar, so open positions are marked
+    to market between trades in the metrics and the equity curve alike.
+    """
+    sources = resolve_sources(data_dir)
+    sizes = {symbol: os.path.getsize(path) for symbol, path in sources.items()}
+    schedule = sorted(sources, key=sizes.get, reverse=True)
+
+    rows = []
+    curves = {}
+    batch_start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_symbol, strategy_class, symbol, sources[symbol],
+                        initial_capital, strategy_params)
+            for symbol in schedule
+        ]
+
+        for future in as_completed(futures):
+            row, equity = future.result()
+            row["file_bytes"] = sizes[row["symbol"]]
+            rows.append(row)
+            curves[row["symbol"]] = equity
+            if progress:
+                progress(len(rows), len(futures), row)
+
+    metrics = pd.DataFrame(rows).set_index("symbol").sort_index()
+    metrics.attrs["wall_seconds"] = time.perf_counter() - batch_start
+    equity = combine_equity(curves, initial_capital)
+
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+        metrics.to_csv(os.path.join(out_dir, "metrics.csv"))
+        equity.to_csv(os.path.join(out_dir, "equity.csv"))
+
+    return metrics, equity
+
+
+def _print_progress(done, total, row):
+    status = row["error"] or f"{row.get('Trades', 0)} trades"
+    print(f"[{done}/{total}] {row['symbol']}: {status} in {row['seconds']:.2f}s", flush=True)
+
+
+def main(argv=None):
+    from strategy.register import load_strategies
+
+    parser = argparse.ArgumentParser(description="Backtest one strategy across every CSV in a directory")
+    parser.add_argument("strategy", help="strategy class name, e.g. BreakoutStrategy")
+    parser.add_argument("data_dir")
+    parser.add_argument("--capital", type=float, default=100000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="batch_results", help="output directory")
+    args = parser.parse_args(argv)
+
+    strategy_class = load_strategies()[args.strategy]
+    metrics, _ = run_batch(strategy_class, args.data_dir, args.capital,
+                           workers=args.workers, out_dir=args.out,
+                           progress=_print_progress)
+
+    print(metrics.to_string())
+    print(f"{len(metrics)} symbols in {metrics.attrs['wall_seconds']:.2f}s -> {args.out}/")
+
+
+if __name__ == "__main__":
+    main()
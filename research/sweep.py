@@ -0,0 +1,137 @@
+# research/sweep.py
+
+import argparse
+import ast
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+
+from data_handler.shared_bars import SharedBars
+from engine import run_backtest
+
+
+def expand_grid(grid):
+    """
+    {"short_window": [10, 20], "long_window": [50]} ->
+    [{"short_window": 10, "long_window": 50}, {"short_window": 20, "long_window": 50}]
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def _run_chunk(strategy_class, symbol, shared_bars, initial_capital, param_sets):
+    """
+    Worker entry point: runs a chunk of parameter sets against the shared
+    bars. A failing run is reported in its row instead of aborting the chunk.
+    """
+    rows = []
+    for run, params in param_sets:
+        start = time.perf_counter()
+        row = dict(params, run=run)
+        try:
+            _, trades, metrics = run_backtest(
+                strategy_class, symbol, None, initial_capital,
+                shared_bars=shared_bars, strategy_params=params
+            )
+            row.update(metrics)
+            row["Trades"] = len(trades)
+            row["error"] = None
+        except Exception as exc:
+            row["error"] = f"{type(exc).__name__}: {exc}"
+        row["seconds"] = time.perf_counter() - start
+        rows.append(row)
+    return rows
+
+
+def iter_sweep(strategy_class, grid, symbol, csv_path, initial_capital=100000,
+               workers=None, chunksize=1):
+    """
+    Runs one backtest per parameter set across a process pool and yields
+    result rows as they complete.
+
+    Bars are loaded once into shared memory and attached by every worker.
+    chunksize parameter sets are sent to a worker per task.
+    """
+    param_sets = list(enumerate(expand_grid(grid)))
+    chunks = [param_sets[i:i + chunksize] for i in range(0, len(param_sets), chunksize)]
+
+    with SharedBars.from_csv(csv_path) as shared:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_run_chunk, strategy_class, symbol, shared.spec,
+                            initial_capital, chunk): chunk
+                for chunk in chunks
+            }
+
+            for future in as_completed(futures):
+                try:
+                    rows = future.result()
+                except Exception as exc:
+                    # the worker itself died; the rest of the sweep carries on
+                    rows = [dict(params, run=run, error=f"{type(exc).__name__}: {exc}")
+                            for run, params in futures[future]]
+                yield from rows
+
+
+def run_sweep(strategy_class, grid, symbol, csv_path, initial_capital=100000,
+              workers=None, chunksize=1):
+    """
+    Runs the whole sweep and returns one row per parameter set (indexed
+    by its position in the grid) with its compute_metrics output, trade
+    count, run time and error (if any).
+    """
+    rows = list(iter_sweep(strategy_class, grid, symbol, csv_path,
+                           initial_capital, workers, chunksize))
+    return results_table(rows)
+
+
+def results_table(rows):
+    """
+    Sweep rows as a DataFrame in grid order.
+    """
+    return pd.DataFrame(rows).sort_values("run").set_index("run")
+
+
+def _parse_param(text):
+    """
+    "short_window=10,20,30" -> ("short_window", [10, 20, 30])
+    """
+    name, _, values = text.partition("=")
+    return name.strip(), [ast.literal_eval(v.strip()) for v in values.split(",")]
+
+
+def main(argv=None):
+    from strategy.register import load_strategies
+
+    parser = argparse.ArgumentParser(description="Parallel parameter sweep over run_backtest")
+    parser.add_argument("strategy", help="strategy class name, e.g. MovingAverageCrossStrategy")
+    parser.add_argument("csv_path")
+    parser.add_argument("--symbol", help="defaults to the CSV file name")
+    parser.add_argument("--param", action="append", default=[], type=_parse_param,
+                        metavar="NAME=V1,V2,...", help="one per strategy parameter")
+    parser.add_argument("--capital", type=float, default=100000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int, default=1)
+    parser.add_argument("--out", help="write the results table to this CSV")
+    args = parser.parse_args(argv)
+
+    strategy_class = load_strategies()[args.strategy]
+    symbol = args.symbol or os.path.splitext(os.path.basename(args.csv_path))[0]
+    grid = dict(args.param)
+
+    rows = []
+    for row in iter_sweep(strategy_class, grid, symbol, args.csv_path,
+                          args.capital, args.workers, args.chunksize):
+        rows.append(row)
+        print(f"[{len(rows)}] {row}", flush=True)
+
+    results = results_table(rows)
+    if args.out:
+        results.to_csv(args.out)
+    print(results.to_string())
+
+
+if __name__ == "__main__":
+    main()
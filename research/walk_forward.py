@@ -0,0 +1,172 @@
+# research/walk_forward.py
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+from data_handler.bar_cache import load_bars
+from data_handler.csv_data_handler import parse_csv
+from data_handler.shared_bars import SharedBars, attach_shared_bars
+from engine import run_backtest
+from performance.metrics import compute_metrics
+from research.sweep import expand_grid
+
+
+def walk_forward_folds(n_bars, train_size, test_size, step=None, anchored=False):
+    """
+    Returns [(train_start, train_end, test_start, test_end), ...] bar index
+    ranges (end exclusive). Each test window directly follows its train
+    window; windows advance by step (default test_size, i.e. back-to-back
+    out-of-sample periods). anchored=True keeps every train window starting
+    at bar 0 (expanding window).
+    """
+    step = step or test_size
+    folds = []
+    start = 0
+
+    while start + train_size + test_size <= n_bars:
+        train_start = 0 if anchored else start
+        train_end = start + train_size
+        folds.append((train_start, train_end, train_end, train_end + test_size))
+        start += step
+
+    return folds
+
+
+def slice_bars(bars, start, end):
+    """
+    Views (not copies) of every bar column over [start, end).
+    """
+    return {col: values[start:end] for col, values in bars.items()}
+
+
+def _score(metrics, objective):
+    score = metrics.get(objective)
+    if score is None or math.isnan(score):
+        return -math.inf
+    return score
+
+
+def _optimize_fold(strategy_class, symbol, shared_bars, initial_capital,
+                   param_sets, train_start, train_end, objective):
+    """
+    Worker entry point: grid-searches one fold's train window on the shared
+    bars and returns (best_params, best_score).
+    """
+    shm, bars = attach_shared_bars(shared_bars)
+    train = slice_bars(bars, train_start, train_end)
+
+    best_params, best_score = param_sets[0], -math.inf
+    for params in param_sets:
+        _, _, metrics = run_backtest(
+            strategy_class, symbol, None, initial_capital,
+            strategy_params=params, bars=train, record_bars=True
+        )
+        score = _score(metrics, objective)
+        if score > best_score:
+            best_params, best_score = params, score
+
+    del train, bars
+    shm.close()
+    return best_params, best_score
+
+
+def _closing_record(bars, trades, capital):
+    """
+    Marks a test window's book to market at its last valid close. The next
+    window starts flat with this equity, as if the position were closed.
+    """
+    closes = bars["Close"][~np.isnan(bars["Close"])]
+    cash, position = capital, 0
+    if trades:
+        cash, position = trades[-1]["cash_after"], trades[-1]["position_after"]
+
+    holdings = position * closes[-1] if len(closes) and position else 0
+    return {
+        "time": pd.Timestamp(bars["Date"][-1]),
+        "cash": cash,
+        "position": position,
+        "holdings": holdings,
+        "total": cash + holdings,
+    }
+
+
+def run_walk_forward(strategy_class, grid, symbol, csv_path, train_size, test_size,
+                     initial_capital=100000, step=None, anchored=False,
+                     objective="Sharpe Ratio", workers=None):
+    """
+    Walk-forward optimization: for every fold, pick the parameter set with
+    the best objective on the train window, then trade it on the following
+    test window.
+
+    The CSV is loaded once and shared with the workers through shared
+    memory; folds are optimized in parallel on views of it. Test windows
+    then run in order on views of the same arrays, each starting with the
+    previous window's equity marked to market at its last bar, and are
+    stitched into one out-of-sample result (with one closing record per
+    window). Every test window starts with a fresh strategy, so indicators
+    warm up again at each fold boundary.
+
+    Train and test runs record holdings on every bar (record_bars=True),
+    so objectives are computed from the full mark-to-market equity curve
+    rather than from the few points where trades happened.
+
+    Returns {"folds", "holdings_history", "trades", "metrics"}, where folds
+    is a DataFrame with each fold's windows, chosen parameters and scores.
+    """
+    param_sets = expand_grid(grid)
+    bars = load_bars(csv_path, parse_csv)
+    folds = walk_forward_folds(len(bars["Date"]), train_size, test_size, step, anchored)
+
+    with SharedBars(bars) as shared:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_optimize_fold, strategy_class, symbol, shared.spec,
+                            initial_capital, param_sets, train_start, train_end, objective)
+                for train_start, train_end, _, _ in folds
+            ]
+            best = [future.result() for future in futures]
+
+    capital = initial_capital
+    holdings_history = []
+    trades = []
+    rows = []
+
+    for (train_start, train_end, test_start, test_end), (params, train_score) in zip(folds, best):
+        test = slice_bars(bars, test_start, test_end)
+        fold_history, fold_trades, fold_metrics = run_backtest(
+            strategy_class, symbol, None, capital,
+            strategy_params=params, bars=test, record_bars=True
+        )
+        closing = _closing_record(test, fold_trades, capital)
+
+        fold_rows = list(fold_history)
+        if fold_rows and fold_rows[-1]["time"] == closing["time"]:
+            # the closing record re-marks the window's last bar
+            fold_rows.pop()
+
+        rows.append(dict(
+            train_start=pd.Timestamp(bars["Date"][train_start]),
+            train_end=pd.Timestamp(bars["Date"][train_end - 1]),
+            test_start=pd.Timestamp(bars["Date"][test_start]),
+            test_end=pd.Timestamp(bars["Date"][test_end - 1]),
+            **params,
+            train_score=train_score,
+            test_score=fold_metrics.get(objective),
+            test_trades=len(fold_trades),
+            start_equity=capital,
+            end_equity=closing["total"],
+        ))
+
+        holdings_history.extend(fold_rows)
+        holdings_history.append(closing)
+        trades.extend(fold_trades)
+        capital = closing["total"]
+
+    return {
+        "folds": pd.DataFrame(rows),
+        "holdings_history": holdings_history,
+        "trades": trades,
+        "metrics": compute_metrics(holdings_history),
+    }
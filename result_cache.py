@@ -0,0 +1,260 @@
+# result_cache.py
+
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import sys
+
+from engine import run_backtest
+
+
+RESULT_CACHE_VERSION = 2
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+# every run goes through these; engine in turn imports the data handler,
+# portfolio, execution, indicator and metrics modules
+RUN_MODULES = ("engine",)
+
+# (path, size, mtime_ns) -> content hash / imported names, so unchanged
+# files are read once
+_file_hashes = {}
+_file_imports = {}
+
+
+def file_digest(path):
+    """
+    SHA-256 of a file's content. The content, not the path or mtime, is
+    what identifies the data: a CSV rewritten with the same bars still hits.
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    digest = _file_hashes.get(memo_key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        digest = _file_hashes[memo_key] = h.hexdigest()
+    return digest
+
+
+def local_module_path(module_name):
+    """
+    Source file of a module inside the repository, found without
+    importing third-party packages; None for anything else.
+    """
+    origin = None
+    for name in dict.fromkeys((module_name.partition(".")[0], module_name)):
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            return None
+        if spec is None:
+            return None
+
+        # namespace packages (no __init__.py) have locations but no origin
+        origin = spec.origin if spec.has_location else None
+        locations = [origin] if origin else list(spec.submodule_search_locations or ())
+        if not locations or not all(
+            os.path.abspath(location).startswith(REPO_ROOT + os.sep) for location in locations
+        ):
+            return None
+    return origin if origin and origin.endswith(".py") else None
+
+
+def imported_modules(path, module_name):
+    """
+    Names a source file imports, anywhere in the file (function-level
+    imports included). "from package import name" lists both package and
+    package.name, since name may be a submodule.
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), module_name, stat.st_size, stat.st_mtime_ns)
+
+    names = _file_imports.get(memo_key)
+    if names is not None:
+        return names
+
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    package = module_name if path.endswith("__init__.py") else module_name.rpartition(".")[0]
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            if node.level:
+                parts = package.split(".") if package else []
+                base = ".".join(parts[:len(parts) - node.level + 1])
+                module = f"{base}.{module}" if base and module else base or module
+            if not module:
+                continue
+            names.append(module)
+            names.extend(f"{module}.{alias.name}" for alias in node.names)
+
+    _file_imports[memo_key] = names = tuple(names)
+    return names
+
+
+def code_files(strategy_class):
+    """
+    Source files a run of strategy_class depends on: the strategy's module
+    and every repository module it or the engine imports, directly or
+    indirectly. None when the strategy's source file is unavailable (e.g.
+    classes defined interactively).
+    """
+    module = sys.modules.get(strategy_class.__module__)
+    path = getattr(module, "__file__", None)
+    if not path or not path.endswith(".py") or not os.path.exists(path):
+        return None
+
+    files = {}
+    pending = [(strategy_class.__module__, path)]
+    pending += [(name, local_module_path(name)) for name in RUN_MODULES]
+    while pending:
+        name, path = pending.pop()
+        if path is None or path in files:
+            continue
+        files[path] = name
+        for imported in imported_modules(path, name):
+            pending.append((imported, local_module_path(imported)))
+    return sorted(files)
+
+
+def code_digest(strategy_class):
+    """
+    SHA-256 over the content of code_files(strategy_class), so an edit to
+    the strategy, to anything it imports from the repository or to the
+    engine, portfolio and execution code invalidates cached results.
+    """
+    files = code_files(strategy_class)
+    if files is None:
+        return None
+
+    h = hashlib.sha256()
+    for path in files:
+        h.update(os.path.relpath(path, REPO_ROOT).encode())
+        h.update(file_digest(path).encode())
+    return h.hexdigest()
+
+
+def result_key(strategy_class, symbol, csv_path, initial_capital, strategy_params=None,
+               record_bars=False):
+    """
+    Content address of one backtest run, or None when it cannot be keyed.
+    """
+    code = code_digest(strategy_class)
+    if code is None:
+        return None
+
+    payload = json.dumps({
+        "version": RESULT_CACHE_VERSION,
+        "data": file_digest(csv_path),
+        "strategy": f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+        "code": code,
+        "params": strategy_params or {},
+        "symbol": symbol,
+        "initial_capital": initial_capital,
+        "record_bars": record_bars,
+    }, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of run_backtest results, one pickle per key, bounded to
+    max_bytes. Least recently used entries are evicted first; a hit
+    refreshes the entry's mtime, which is the recency order.
+    """
+
+    def __init__(self, root="data/result_cache", max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}.pkl")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """
+        Stores a result. Failures are ignored: the cache is an
+        optimisation, not a requirement.
+        """
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self.evict()
+        except OSError:
+            pass
+
+    def entries(self):
+        """
+        [(mtime, size, path), ...] oldest first.
+        """
+        entries = []
+        for name in os.listdir(self.root):
+            if name.endswith(".pkl"):
+                path = os.path.join(self.root, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+
+
+def cached_backtest(cache, strategy_class, symbol, csv_path, initial_capital,
+                    strategy_params=None, record_bars=False):
+    """
+    run_backtest through a ResultCache: returns the stored
+    (holdings_history, trades, metrics) when the data content, code,
+    parameters and capital match a previous run.
+    """
+    key = result_key(strategy_class, symbol, csv_path, initial_capital, strategy_params,
+                     record_bars)
+    if key is not None:
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+    result = run_backtest(strategy_class, symbol, csv_path, initial_capital,
+                          strategy_params=strategy_params, record_bars=record_bars)
+    if key is not None:
+        cache.put(key, result)
+    return result
@@ -0,0 +1,126 @@
+# strategy/batched_ma_crossover.py
+
+import numpy as np
+from events.events import SignalEvent
+from indicators.streaming import TIE_TOLERANCE
+
+
+class BatchedMovingAverageCross:
+    """
+    MovingAverageCrossStrategy for many (short_window, long_window)
+    combinations in one instance.
+
+    One ring buffer of recent closes (as long as the largest window) is
+    shared by every combination, and a running sum per distinct window is
+    updated with one vectorized gather per bar, so per-bar cost grows with
+    the number of combinations as array width. Combination k's signals go
+    to buses[k], preceded by the bar's MarketEvent so its portfolio and
+    execution handler price the order on that bar exactly as in a
+    single-strategy run; combinations that do not signal are not touched.
+    Near-ties are re-compared with np.mean over the window, as
+    MovingAverageCrossStrategy does, so signals match it exactly.
+
+    Not named *Strategy on purpose: it drives one bus per combination
+    rather than a single engine stack, so the strategy registry skips it.
+    Run it with engine.run_batched_backtest.
+    """
+
+    def __init__(self, buses, symbol, param_sets):
+        self.buses = buses
+        self.symbol = symbol
+
+        long_windows = np.array([p.get("long_window", 50) for p in param_sets], dtype=np.int64)
+        short_windows = np.array([p.get("short_window", 20) for p in param_sets], dtype=np.int64)
+        # the short average never spans more than the long window
+        short_windows = np.minimum(short_windows, long_windows)
+        self.short_windows = short_windows
+        self.long_windows = long_windows
+
+        windows, inverse = np.unique(np.concatenate([short_windows, long_windows]),
+                                     return_inverse=True)
+        self.windows = windows
+        self.short_index = inverse[:len(param_sets)]
+        self.long_index = inverse[len(param_sets):]
+
+        self.size = int(windows.max()) + 1 if len(windows) else 1
+        self.closes = np.zeros(self.size)  # NaN closes are stored as 0
+        self.sums = np.zeros(len(windows))
+        self.count = 0
+        self.last_nan = -self.size
+
+        self.in_market = np.zeros(len(param_sets), dtype=bool)
+        self.signalled = np.empty(0, dtype=np.intp)
+
+    def _resum(self):
+        """
+        Recomputes every window sum from the ring buffer, so rounding error
+        from the running updates never outlives one pass over the buffer.
+        """
+        t = self.count
+        newest_first = self.closes[np.arange(t - 1, t - 1 - self.size, -1) % self.size]
+        totals = np.concatenate(([0.0], np.cumsum(newest_first)))
+        self.sums = totals[self.windows]
+
+    def _window_mean(self, window):
+        """
+        np.mean of the last window closes, oldest first.
+        """
+        t = self.count
+        return np.mean(self.closes[np.arange(t - window, t) % self.size])
+
+    def _break_ties(self, ties, short_ma, long_ma):
+        """
+        Replaces running means with np.mean values for the combinations in
+        ties, so rounding cannot decide their comparison.
+        """
+        means = {}
+        for k in np.flatnonzero(ties):
+            for window, values in ((self.short_windows[k], short_ma), (self.long_windows[k], long_ma)):
+                if window not in means:
+                    means[window] = self._window_mean(window)
+                values[k] = means[window]
+
+    def calculate_signals(self, event):
+        """
+        Updates every combination for one bar and emits the resulting
+        LONG / EXIT signals. signalled holds the combinations that acted.
+        """
+        if event.symbol != self.symbol:
+            self.signalled = np.empty(0, dtype=np.intp)
+            return
+
+        t = self.count
+        close = event.close
+        if close != close:
+            self.last_nan = t
+            close = 0.0
+
+        # slot t - w still holds the close that leaves each window (zero
+        # during warm-up), because the buffer is longer than any window
+        self.sums += close - self.closes[(t - self.windows) % self.size]
+        self.closes[t % self.size] = close
+        self.count = t + 1
+        if self.count % self.size == 0:
+            self._resum()
+
+        means = self.sums / self.windows
+        means[self.last_nan > t - self.windows] = np.nan
+        short_ma = means[self.short_index]
+        long_ma = means[self.long_index]
+        ready = self.count >= self.long_windows
+
+        ties = ready & (np.abs(short_ma - long_ma)
+                        <= TIE_TOLERANCE * np.maximum(np.abs(short_ma), np.abs(long_ma)))
+        if ties.any():
+            self._break_ties(ties, short_ma, long_ma)
+
+        enter = ready & (short_ma > long_ma) & ~self.in_market
+        exit = ready & (short_ma < long_ma) & self.in_market
+        self.in_market[enter] = True
+        self.in_market[exit] = False
+        self.signalled = np.flatnonzero(enter | exit)
+
+        for k in self.signalled:
+            bus = self.buses[k]
+            bus.put(event)
+            bus.put(SignalEvent(self.symbol, event.time, "LONG" if enter[k] else "EXIT"))
@@ -1,6 +1,8 @@
-from collections import deque
-import numpy as np
 from events.events import SignalEvent
+from indicators.registry import IndicatorRegistry
+from indicators.streaming import nearly_equal
+from indicators.vectorized import rolling_max, rolling_mean
+from strategy.vectorized import long_flat_positions
 
 class BreakoutStrategy:
 
@@ -8,12 +10,16 @@ class BreakoutStrategy:
 #Exit when price drops below moving average
 
 
-    def __init__(self, events, symbol, lookback=20):
+    def __init__(self, events, symbol, lookback=20, indicators=None):
         self.events = events
         self.symbol = symbol
         self.lookback = lookback
 
-        self.prices = deque(maxlen=lookback)
+        # shared IndicatorRegistry, or a private one
+        self.owns_indicators = indicators is None
+        self.indicators = IndicatorRegistry() if indicators is None else indicators
+        self.highest = self.indicators.get(symbol, "max", lookback)
+        self.mean_price = self.indicators.get(symbol, "sma", lookback)
         self.in_market = False
 
     def calculate_signals(self, event):
@@ -21,13 +27,17 @@ class BreakoutStrategy:
         if event.symbol != self.symbol:
             return
 
-        self.prices.append(event.close)
+        if self.owns_indicators:
+            self.indicators.update(event)
 
-        if len(self.prices) < self.lookback:
+        if not self.mean_price.ready:
             return
 
-        highest = max(self.prices)
-        mean_price = np.mean(self.prices)
+        highest = self.highest.value
+        mean_price = self.mean_price.value
+        if nearly_equal(event.close, mean_price):
+            # rounding must not decide a near-tie: compare the np.mean value
+            mean_price = self.mean_price.recompute()
 
         # ---- SIGNAL LOGIC ----
         if event.close >= highest and not self.in_market:
@@ -37,3 +47,11 @@ class BreakoutStrategy:
         elif event.close < mean_price and self.in_market:
             self.events.put(SignalEvent(self.symbol, event.time, "EXIT"))
             self.in_market = False
+
+    def generate_positions(self, bars):
+        # vectorized equivalent of calculate_signals: 1 = long, 0 = flat
+        closes = bars["Close"]
+        highest = rolling_max(closes, self.lookback)
+        mean_price = rolling_mean(closes, self.lookback)
+
+        return long_flat_positions(closes >= highest, closes < mean_price)
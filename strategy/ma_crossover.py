@@ -1,23 +1,32 @@
 # strategy/ma_crossover.py
 
-from collections import deque
-import numpy as np
 from events.events import SignalEvent
+from indicators.registry import IndicatorRegistry
+from indicators.streaming import nearly_equal
+from indicators.vectorized import rolling_mean
+from strategy.vectorized import long_flat_positions
 
 
 class MovingAverageCrossStrategy:
     """
     Simple Moving Average Crossover Strategy.
     Generates LONG and EXIT signals.
+
+    Pass a shared IndicatorRegistry as indicators to reuse averages other
+    strategies on the symbol already compute; otherwise it keeps its own.
     """
 
-    def __init__(self, events, symbol, short_window=20, long_window=50):
+    def __init__(self, events, symbol, short_window=20, long_window=50, indicators=None):
         self.events = events
         self.symbol = symbol
         self.short_window = short_window
         self.long_window = long_window
 
-        self.prices = deque(maxlen=long_window)
+        self.owns_indicators = indicators is None
+        self.indicators = IndicatorRegistry() if indicators is None else indicators
+        # the short average never spans more than the long window
+        self.short_ma = self.indicators.get(symbol, "sma", min(short_window, long_window))
+        self.long_ma = self.indicators.get(symbol, "sma", long_window)
         self.in_market = False
 
     def calculate_signals(self, event):
@@ -27,13 +36,18 @@ class MovingAverageCrossStrategy:
         if event.symbol != self.symbol:
             return
 
-        self.prices.append(event.close)
+        if self.owns_indicators:
+            self.indicators.update(event)
 
-        if len(self.prices) < self.long_window:
+        if not self.long_ma.ready:
             return
 
-        short_ma = np.mean(list(self.prices)[-self.short_window:])
-        long_ma = np.mean(self.prices)
+        short_ma = self.short_ma.value
+        long_ma = self.long_ma.value
+        if nearly_equal(short_ma, long_ma):
+            # rounding must not decide a near-tie: compare np.mean values
+            short_ma = self.short_ma.recompute()
+            long_ma = self.long_ma.recompute()
 
         if short_ma > long_ma and not self.in_market:
             signal = SignalEvent(
@@ -52,4 +66,15 @@ class MovingAverageCrossStrategy:
             )
             self.events.put(signal)
             self.in_market = False
+
+    def generate_positions(self, bars):
+        """
+        Vectorized equivalent of calculate_signals over whole bar arrays.
+        Returns 1 where the strategy is long and 0 where it is flat.
+        """
+        closes = bars["Close"]
+        short_ma = rolling_mean(closes, self.short_window)
+        long_ma = rolling_mean(closes, self.long_window)
+
+        return long_flat_positions(short_ma > long_ma, short_ma < long_ma)
     
\ No newline at end of file
@@ -1,24 +1,267 @@
+# strategy/register.py
+
+import ast
 import importlib
-import os
 import inspect
+import json
+import os
+from collections.abc import Mapping
+from importlib.metadata import entry_points
 
-def load_strategies():
-    strategies = {}
+
+STRATEGY_FOLDER = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(STRATEGY_FOLDER, ".manifest.json")
+MANIFEST_VERSION = 2
+ENTRY_POINT_GROUP = "backtester.strategies"
+
+SKIP_FILES = ("__init__.py", "register.py")
+# constructor arguments supplied by the engine, not strategy parameters
+ENGINE_ARGUMENTS = ("self", "events", "symbol", "indicators")
+
+_registered = {}
+
+
+def register_strategy(name, target, params=None):
+    """
+    Declares a strategy without importing it. target is "module:Class";
+    params ({name: default}) is its parameter schema, read from the class
+    on first use when not given.
+    """
+    _registered[name] = {"target": target, "params": params}
+
+
+def _literal(node):
+    if node is None:
+        return None
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+
+def _init_params(init):
+    """
+    {name: default} for a parsed __init__ (None for non-literal or
+    missing defaults).
+    """
+    if init is None:
+        return {}
+
+    args = init.args
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    pairs = list(zip(positional, defaults)) + list(zip(args.kwonlyargs, args.kw_defaults))
+
+    return {arg.arg: _literal(default) for arg, default in pairs
+            if arg.arg not in ENGINE_ARGUMENTS}
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def scan_module(path):
+    """
+    Parses a source file, without importing it, into its top-level
+    classes: {name: {"bases", "signals", "params"}}, where signals says
+    whether the class body defines calculate_signals and params is the
+    schema of its own __init__ (None when it inherits one).
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    classes = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        methods = {item.name: item for item in node.body if isinstance(item, ast.FunctionDef)}
+        init = methods.get("__init__")
+        classes[node.name] = {
+            "bases": [_base_name(base) for base in node.bases],
+            "signals": "calculate_signals" in methods,
+            "params": _init_params(init) if init is not None else None,
+        }
+    return classes
 
 
-    strategy_folder = os.path.dirname(__file__)
+def _find_class(classes, module_name, name):
+    """
+    Module defining a base class name: the class's own module first, then
+    any scanned module. None when it is not in the folder.
+    """
+    if name in classes[module_name]:
+        return module_name
+    for other, found in classes.items():
+        if name in found:
+            return other
+    return None
 
-    for file in os.listdir(strategy_folder):
 
-        if file.endswith(".py") and file not in ["__init__.py", "registry.py"]:
-        
-            module_name = file[:-3]  # remove .py
-            module = importlib.import_module(f"strategy.{module_name}")
+def _inherited(classes, module_name, name, seen=frozenset()):
+    """
+    (signals, params, resolved) for a class, following its bases through
+    the scanned modules in MRO-like, depth-first order. resolved is False
+    when some base could not be found; params is None when the __init__
+    that applies is not known.
+    """
+    record = classes[module_name][name]
+    signals = record["signals"]
+    params = record["params"]
+    params_known = params is not None
+    resolved = True
+    seen = seen | {(module_name, name)}
 
-        # find class inside module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if "Strategy" in name:
-                    strategies[name] = obj
+    for base in record["bases"]:
+        if base == "object":
+            continue
+        owner = _find_class(classes, module_name, base) if base else None
+        if owner is None or (owner, base) in seen:
+            resolved = False
+            params_known = True  # an unknown base may supply __init__
+            continue
 
+        base_signals, base_params, base_resolved = _inherited(classes, owner, base, seen)
+        signals = signals or base_signals
+        resolved = resolved and base_resolved
+        if not params_known:
+            params = base_params
+            params_known = base_params is not None or not base_resolved
+
+    if params is None and resolved:
+        params = {}
+    return signals, params, resolved
+
+
+def find_strategies(classes):
+    """
+    {name: {"target", "params"}} from {module name: scan_module(...)}:
+    classes with "Strategy" in their name that define or inherit
+    calculate_signals. A class whose bases are not all in the folder is
+    listed too, with its schema left to be read from the class
+    (params None) unless it defines __init__ itself.
+    """
+    strategies = {}
+    for module_name, found in classes.items():
+        for name in found:
+            if "Strategy" not in name:
+                continue
+            signals, params, resolved = _inherited(classes, module_name, name)
+            if signals or not resolved:
+                strategies[name] = {"target": f"{module_name}:{name}", "params": params}
     return strategies
 
+
+def build_manifest(folder=STRATEGY_FOLDER, package="strategy", manifest_path=MANIFEST_PATH):
+    """
+    {name: {"target", "params"}} for every strategy in folder. Scan
+    results are cached per file in manifest_path and reused while the
+    file's size and mtime are unchanged, so only new or edited files are
+    parsed; inheritance is resolved across all files on every call.
+    Failing to write the cache is ignored.
+    """
+    try:
+        with open(manifest_path) as f:
+            cached = json.load(f)
+        files = cached["files"] if cached.get("version") == MANIFEST_VERSION else {}
+    except (OSError, ValueError, KeyError, AttributeError):
+        files = {}
+
+    current = {}
+    for file in sorted(os.listdir(folder)):
+        if not file.endswith(".py") or file in SKIP_FILES:
+            continue
+
+        path = os.path.join(folder, file)
+        stat = os.stat(path)
+        key = [stat.st_size, stat.st_mtime_ns]
+
+        entry = files.get(file)
+        if entry is None or entry.get("stat") != key:
+            entry = {"stat": key, "classes": scan_module(path)}
+        current[file] = entry
+
+    if current != files:
+        tmp_path = manifest_path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": current}, f, default=repr)
+            os.replace(tmp_path, manifest_path)
+        except OSError:
+            pass
+
+    return find_strategies({
+        f"{package}.{file[:-3]}": entry["classes"] for file, entry in current.items()
+    })
+
+
+def entry_point_strategies(group=ENTRY_POINT_GROUP):
+    """
+    Strategies published by installed packages, e.g. in pyproject.toml:
+    [project.entry-points."backtester.strategies"]
+    MyStrategy = "my_package.strategies:MyStrategy"
+    """
+    return {
+        ep.name: {"target": ep.value, "params": None}
+        for ep in entry_points(group=group)
+    }
+
+
+class StrategyRegistry(Mapping):
+    """
+    Strategy name -> class. A strategy's module is imported the first time
+    it is looked up; names, import targets and parameter schemas
+    (specs / params()) are available without importing anything.
+    """
+
+    def __init__(self, specs):
+        self.specs = specs
+        self._classes = {}
+
+    def __getitem__(self, name):
+        strategy_class = self._classes.get(name)
+        if strategy_class is None:
+            module_name, _, attr = self.specs[name]["target"].partition(":")
+            strategy_class = getattr(importlib.import_module(module_name), attr.strip())
+            self._classes[name] = strategy_class
+        return strategy_class
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def __len__(self):
+        return len(self.specs)
+
+    def params(self, name):
+        """
+        {parameter: default} for a strategy. Only strategies registered
+        without a schema (e.g. entry points) are imported to read it.
+        """
+        params = self.specs[name]["params"]
+        if params is None:
+            signature = inspect.signature(self[name])
+            params = {
+                p.name: None if p.default is inspect.Parameter.empty else p.default
+                for p in signature.parameters.values()
+                if p.name not in ENGINE_ARGUMENTS
+                and p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+            }
+            self.specs[name]["params"] = params
+        return params
+
+
+def load_strategies(entry_point_group=ENTRY_POINT_GROUP):
+    """
+    Every available strategy: the strategy folder (via the manifest), then
+    register_strategy() declarations, then entry points. The first source
+    to define a name wins. Nothing is imported until a strategy is used.
+    """
+    specs = build_manifest()
+    for source in (_registered, entry_point_strategies(entry_point_group)):
+        for name, spec in source.items():
+            specs.setdefault(name, dict(spec))
+    return StrategyRegistry(specs)
@@ -1,17 +1,22 @@
-from collections import deque
-import numpy as np
 from events.events import SignalEvent
+from indicators.registry import IndicatorRegistry
+from indicators.streaming import nearly_equal
+from indicators.vectorized import rolling_rsi
+from strategy.vectorized import long_flat_positions
 
 class RSIReversionStrategy:
 
 
 
-    def __init__(self, events, symbol, period=14):
+    def __init__(self, events, symbol, period=14, indicators=None):
         self.events = events
         self.symbol = symbol
         self.period = period
 
-        self.prices = deque(maxlen=period+1)
+        # shared IndicatorRegistry, or a private one
+        self.owns_indicators = indicators is None
+        self.indicators = IndicatorRegistry() if indicators is None else indicators
+        self.rsi = self.indicators.get(symbol, "rsi", period)
         self.in_market = False
 
     def calculate_signals(self, event):
@@ -19,24 +24,17 @@ class RSIReversionStrategy:
         if event.symbol != self.symbol:
             return
 
-        self.prices.append(event.close)
+        if self.owns_indicators:
+            self.indicators.update(event)
+        rsi = self.rsi.value
+        if nearly_equal(rsi, 30) or nearly_equal(rsi, 50):
+            # rounding must not decide a near-tie: use the np.mean value
+            rsi = self.rsi.recompute()
 
-        if len(self.prices) < self.period + 1:
+        # not warmed up yet, or no losses in the window
+        if rsi != rsi:
             return
 
-        deltas = np.diff(self.prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-
-        avg_gain = np.mean(gains)
-        avg_loss = np.mean(losses)
-
-        if avg_loss == 0:
-            return
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
         # ---- SIGNAL LOGIC ----
         if rsi < 30 and not self.in_market:
             self.events.put(SignalEvent(self.symbol, event.time, "LONG"))
@@ -46,3 +44,9 @@ class RSIReversionStrategy:
             self.events.put(SignalEvent(self.symbol, event.time, "EXIT"))
             self.in_market = False
 
+    def generate_positions(self, bars):
+        # vectorized equivalent of calculate_signals: 1 = long, 0 = flat
+        rsi = rolling_rsi(bars["Close"], self.period)
+
+        return long_flat_positions(rsi < 30, rsi > 50)
+
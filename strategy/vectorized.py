@@ -0,0 +1,23 @@
+# strategy/vectorized.py
+
+import numpy as np
+
+
+def long_flat_positions(enter, exit):
+    """
+    Replays a long/flat strategy's in_market flag over whole arrays.
+
+    enter[i] / exit[i] are the bar-i conditions for a LONG / EXIT signal;
+    they must never both be true on the same bar. Returns an int8 array
+    holding 1 while the strategy is in the market and 0 otherwise, so
+    LONG/EXIT signals sit exactly where the array changes value.
+    """
+    marks = np.where(enter, 1, np.where(exit, 0, -1)).astype(np.int8)
+
+    # carry the last LONG/EXIT mark forward over unmarked bars
+    last_mark = np.where(marks >= 0, np.arange(len(marks)), 0)
+    np.maximum.accumulate(last_mark, out=last_mark)
+
+    positions = marks[last_mark]
+    positions[positions < 0] = 0
+    return positions